@@ -0,0 +1,67 @@
+"""Jinja template loading shared by the actions that render markdown.
+
+Lives outside any single action and is put on ``sys.path`` by the action
+scripts (``actions/_lib``); ``scripts/compile_templates.py`` uses the same
+options. jinja2 is imported lazily so callers that render nothing never load it.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from jinja2 import Template
+
+# Must match the options the precompiled modules were generated with.
+TEMPLATE_OPTIONS: dict[str, Any] = {
+    "autoescape": False,
+    "trim_blocks": True,
+    "lstrip_blocks": True,
+}
+TEMPLATE_CACHE_DIR = Path(
+    os.environ.get("LOOM_TEMPLATE_CACHE") or Path.home() / ".cache" / "loom-actions" / "jinja"
+)
+
+
+def compiled_templates_dir(tmpl: Path) -> Path | None:
+    """Return the precompiled module directory for ``tmpl`` if it is still valid."""
+    import jinja2
+
+    compiled = tmpl.parent / "compiled"
+    try:
+        manifest = json.loads((compiled / "manifest.json").read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    series = ".".join(jinja2.__version__.split(".")[:2])
+    digest = hashlib.sha256(tmpl.read_bytes()).hexdigest()
+    if manifest.get("jinja2") != series or manifest.get("templates", {}).get(tmpl.name) != digest:
+        return None
+    return compiled
+
+
+def load_template(template_path: str) -> Template:
+    """Load a report template, skipping compilation whenever possible.
+
+    Bundled templates are precompiled at release time (``make compile-templates``)
+    and loaded straight from their modules. Custom or edited templates are compiled
+    from source once and then reused through a ``FileSystemBytecodeCache``.
+    """
+    from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader, ModuleLoader
+
+    tmpl = Path(template_path)
+    compiled = compiled_templates_dir(tmpl)
+    if compiled is not None:
+        env = Environment(loader=ModuleLoader(str(compiled)), **TEMPLATE_OPTIONS)
+        return env.get_template(tmpl.name)
+
+    TEMPLATE_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    env = Environment(
+        loader=FileSystemLoader(str(tmpl.parent)),
+        bytecode_cache=FileSystemBytecodeCache(str(TEMPLATE_CACHE_DIR)),
+        **TEMPLATE_OPTIONS,
+    )
+    return env.get_template(tmpl.name)
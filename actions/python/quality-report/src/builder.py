@@ -1,34 +1,120 @@
 from __future__ import annotations
 
 import argparse
+import codecs
+import glob
+import gzip
+import hashlib
+import heapq
+import io
 import json
+import math
+import mmap
+import os
+import re
+import shutil
 import sys
-import xml.etree.ElementTree as ET
-from dataclasses import asdict, dataclass
+import time
+from array import array
+from collections import Counter
+from collections.abc import Callable, Iterable, Iterator
+from contextlib import ExitStack, closing, contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, fields, is_dataclass
+from functools import lru_cache
+from operator import attrgetter
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any, BinaryIO, ClassVar, Generic, TextIO, TypeVar
 
-from jinja2 import Environment, FileSystemLoader
+# jinja2 and xml.etree are imported where they are used so that the
+# --summary-only path, which renders nothing, does not pay for them.
+if TYPE_CHECKING:
+    import xml.etree.ElementTree as ET
+
+# Template loading is shared with the other actions that render markdown.
+sys.path.insert(0, str(Path(__file__).resolve().parents[3] / "_lib"))
+from loom_templates import load_template  # noqa: E402
 
 SEVERITY_ORDER = {"none": 0, "low": 1, "medium": 2, "high": 3}
+PYRIGHT_SEVERITY_ORDER = {"error": 0, "warning": 1, "information": 2}
+# Fields that identify a finding independently of its line: (path, rule, message).
+FINGERPRINT_FIELDS = {
+    "ruff": ("filename", "code", "message"),
+    "pyright": ("file", "rule", "message"),
+    "bandit": ("filename", "test_id", "issue_text"),
+}
+# Where summaries written before fingerprints existed keep their finding samples.
+BASELINE_SAMPLE_KEYS = {"ruff": "sample", "pyright": "diagnostics", "bandit": "findings"}
+# Report sections filled from each tool's artifacts; a timed-out tool leaves them incomplete.
+TOOL_SECTIONS = {
+    "ruff": ("ruff",),
+    "pyright": ("pyright",),
+    "pytest": ("junit", "coverage"),
+    "bandit": ("bandit",),
+}
 MAX_ITEMS = 50
-MAX_PREVIEW_CHARS = 2000
+COVERAGE_SUFFIXES = {".json": "json", ".xml": "cobertura", ".lcov": "lcov", ".info": "lcov"}
+SQLITE_HEADER = b"SQLite format 3\x00"
+SUMMARY_FORMATS = ("pretty", "compact", "gzip", "zstd")
+GZIP_MAGIC = b"\x1f\x8b"
+ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+SARIF_SCHEMA = "https://json.schemastore.org/sarif-2.1.0.json"
+SARIF_LEVELS = {
+    "error": "error",
+    "warning": "warning",
+    "information": "note",
+    "high": "error",
+    "medium": "warning",
+    "low": "note",
+}
+TOOL_CACHE_STATES = ("warm", "partial", "cold")
+MAX_MISSING_SPANS = 20
+# GitHub rejects comment bodies over 65536 characters; leave room for hidden tags.
+REPORT_MAX_BYTES = 64000
+SECTION_MAX_BYTES = 16000
+BUDGET_NOTICE_RESERVE = 256
+SECTION_MARK = "\x1e"
+JSON_CHUNK_SIZE = 1 << 16
+# Artifacts up to this size are read in one call and decoded in memory.
+SMALL_ARTIFACT_BYTES = 8 << 20
+# Up to this size artifacts are mapped with mmap; beyond it they are streamed.
+STREAM_ARTIFACT_BYTES = 512 << 20
+MMAP_CHUNK_SIZE = 1 << 20
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+_NUMBER_CONTINUATION = frozenset("0123456789.eE+-")
+# Set by parse_partial: JSON and XML streams end quietly at a truncated tail.
+PARTIAL_ARTIFACTS: ContextVar[bool] = ContextVar("partial_artifacts", default=False)
+
+T = TypeVar("T")
 
 
-@dataclass
+@dataclass(slots=True)
 class FailedTest:
     nodeid: str
     message: str
 
 
-@dataclass
+def _encode_line_runs(runs: array[int]) -> str:
+    return "[" + ",".join(f"[{runs[i]},{runs[i + 1]}]" for i in range(0, len(runs), 2)) + "]"
+
+
+@dataclass(slots=True)
 class CoverageFile:
     path: str
     percent: float
-    missing_lines: list[int]
+    # Missing lines as flattened inclusive (start, end) runs: [12, 480, 502, 502].
+    missing_ranges: array[int]
 
+    # Members whose JSON form is not the attribute value itself (see encode_record).
+    JSON_MEMBERS: ClassVar[dict[str, Callable[[Any], str]]] = {"missing_ranges": _encode_line_runs}
 
-@dataclass
+    @property
+    def missing_spans(self) -> str:
+        return format_line_ranges(self.missing_ranges)
+
+
+@dataclass(slots=True)
 class BanditIssue:
     filename: str
     line_number: int
@@ -39,15 +125,91 @@ class BanditIssue:
     issue_text: str
 
 
-@dataclass
+@dataclass(slots=True)
 class CommandResult:
     name: str
     command: str
     exit_code: int
     status: str
+    artifacts: str = ""
+    # Resource usage columns written by runner.py; absent in older status files.
+    wall_seconds: float | None = None
+    cpu_seconds: float | None = None
+    max_rss_kb: int | None = None
+
+
+def compress_line_ranges(lines: Iterable[int]) -> array[int]:
+    """Collapse ascending line numbers into flattened inclusive ``(start, end)`` runs."""
+    runs: array[int] = array("i")
+    for line in lines:
+        if runs and line <= runs[-1] + 1:
+            runs[-1] = max(runs[-1], line)
+        else:
+            runs.append(line)
+            runs.append(line)
+    return runs
+
+
+def line_mask(lines: Iterable[int]) -> int:
+    """Pack line numbers into an int bitmap, bit ``n`` set for line ``n``."""
+    bitmap = bytearray()
+    for line in lines:
+        index = line >> 3
+        if index >= len(bitmap):
+            bitmap.extend(bytes(index + 1 - len(bitmap)))
+        bitmap[index] |= 1 << (line & 7)
+    return int.from_bytes(bitmap, "little")
+
+
+def mask_lines(mask: int) -> Iterator[int]:
+    """Yield the line numbers set in a ``line_mask`` bitmap, in ascending order."""
+    data = mask.to_bytes((mask.bit_length() + 7) // 8, "little")
+    for index, byte in enumerate(data):
+        while byte:
+            low = byte & -byte
+            yield (index << 3) + low.bit_length() - 1
+            byte ^= low
+
+
+def expand_inputs(patterns: Iterable[str]) -> list[str]:
+    """Expand repeated ``--junit``/``--coverage`` values; globs match in sorted order."""
+    paths: list[str] = []
+    for pattern in patterns:
+        if glob.has_magic(pattern):
+            paths.extend(sorted(glob.glob(pattern, recursive=True)))
+        else:
+            paths.append(pattern)
+    return list(dict.fromkeys(paths))
+
+
+def format_line_ranges(runs: array[int], max_spans: int = MAX_MISSING_SPANS) -> str:
+    spans = [
+        str(runs[i]) if runs[i] == runs[i + 1] else f"{runs[i]}-{runs[i + 1]}"
+        for i in range(0, min(len(runs), max_spans * 2), 2)
+    ]
+    hidden = len(runs) // 2 - len(spans)
+    if hidden > 0:
+        spans.append(f"… (+{hidden} more)")
+    return ", ".join(spans)
 
 
-@dataclass
+@dataclass(slots=True)
+class BaselineMatch:
+    fingerprints: list[str]
+    known: int = 0
+
+
+@dataclass(slots=True)
+class ArtifactStat:
+    name: str
+    path: str
+    mode: str
+    size: int
+    bytes_read: int
+    seconds: float
+
+
+@dataclass(slots=True)
 class Summary:
     ruff_issues: int
     pyright_errors: int
@@ -61,159 +223,1372 @@ class Summary:
     bandit_blocking: bool
 
 
-def read_json(path: str) -> Any:
-    p = Path(path)
-    if not p.exists() or not p.read_text(encoding="utf-8").strip():
-        return {}
-    return json.loads(p.read_text(encoding="utf-8"))
-
-
-def parse_ruff(path: str) -> list[dict[str, Any]]:
-    data = read_json(path)
-    return data if isinstance(data, list) else []
-
-
-def parse_pyright(path: str) -> tuple[int, int, list[dict[str, Any]]]:
-    data = read_json(path)
-    if not isinstance(data, dict):
-        return 0, 0, []
-
-    summary = data.get("summary", {}) or {}
-    errors = int(summary.get("errorCount", 0) or 0)
-    warnings = int(summary.get("warningCount", 0) or 0)
-    diags = data.get("generalDiagnostics", []) or []
-
-    normalized: list[dict[str, Any]] = []
-    for d in diags[:MAX_ITEMS]:
-        fr = d.get("file") or ""
-        msg = d.get("message") or ""
-        sev = d.get("severity") or ""
-        rule = d.get("rule") or ""
-        rng = d.get("range") or {}
-        start = rng.get("start") or {}
-        normalized.append(
-            {
-                "file": fr,
-                "line": int(start.get("line", 0) or 0) + 1,
-                "severity": sev,
-                "rule": rule,
-                "message": msg,
-            }
+class RawJSON(str):
+    """Already encoded JSON that ``iter_json`` copies through unchanged."""
+
+    __slots__ = ()
+
+
+_encode_str = json.encoder.encode_basestring
+_encode_any = json.JSONEncoder(ensure_ascii=False, separators=(",", ":")).encode
+
+
+def _encode_float(value: float) -> str:
+    return float.__repr__(value) if math.isfinite(value) else _encode_any(value)
+
+
+_JSON_SCALARS: dict[type, Callable[[Any], str]] = {
+    str: _encode_str,
+    RawJSON: str.__str__,
+    int: int.__repr__,
+    float: _encode_float,
+    bool: lambda value: "true" if value else "false",
+    type(None): lambda _: "null",
+}
+
+
+def _is_record(value: Any) -> bool:
+    return is_dataclass(value) and not isinstance(value, type)
+
+
+def _encode_value(value: Any) -> str:
+    encode = _JSON_SCALARS.get(type(value))
+    if encode is not None:
+        return encode(value)
+    if _is_record(value):
+        return encode_record(value)
+    if isinstance(value, list | tuple):
+        return "[" + ",".join(map(_encode_value, value)) + "]"
+    return _encode_any(value)
+
+
+@lru_cache(maxsize=32)
+def _record_members(cls: type) -> tuple[tuple[str, ...], Callable[[Any], Any], tuple[Any, ...]]:
+    """Return a record class's encoded member keys, attribute getter and value encoders."""
+    names = tuple(f.name for f in fields(cls))
+    custom = getattr(cls, "JSON_MEMBERS", {})
+    getter = attrgetter(*names)
+    get = getter if len(names) > 1 else lambda record: (getter(record),)
+    encoders = tuple(custom.get(name, _encode_value) for name in names)
+    return tuple(f"{_encode_str(name)}:" for name in names), get, encoders
+
+
+def encode_record(record: Any, **extra: Any) -> str:
+    """Encode a record dataclass as compact JSON, reading its slots directly.
+
+    Same output as encoding ``{**extra, **asdict(record)}``, without the
+    recursive copy ``asdict`` makes or any intermediate dict.
+    """
+    keys, get, encoders = _record_members(type(record))
+    members = [
+        key + encode(value) for key, encode, value in zip(keys, encoders, get(record), strict=True)
+    ]
+    if extra:
+        members[:0] = [f"{_encode_str(key)}:{_encode_value(value)}" for key, value in extra.items()]
+    return "{" + ",".join(members) + "}"
+
+
+def record_fields(record: Any) -> dict[str, Any]:
+    """Shallow ``{name: value}`` view of a record, for consumers that need a mapping."""
+    keys, get, encoders = _record_members(type(record))
+    return {
+        f.name: RawJSON(encode(value)) if encode is not _encode_value else value
+        for f, encode, value in zip(fields(record), encoders, get(record), strict=True)
+    }
+
+
+def iter_json(value: Any, indent: int | None = None, level: int = 0) -> Iterator[str]:
+    """Yield ``value`` as JSON text, compact or indented like ``json.dumps(indent=...)``.
+
+    Record dataclasses are encoded from their attributes and ``RawJSON``
+    fragments are copied as they are, so large finding lists pre-encoded by
+    ``FindingIndex`` are never decoded or walked again.
+    """
+    encode = _JSON_SCALARS.get(type(value))
+    if encode is not None:
+        yield encode(value)
+        return
+    if _is_record(value):
+        if indent is None:
+            yield encode_record(value)
+            return
+        value = record_fields(value)
+    if isinstance(value, dict):
+        items: Iterable[tuple[str | None, Any]] = value.items()
+        brackets = "{}"
+    elif isinstance(value, list | tuple):
+        items = ((None, item) for item in value)
+        brackets = "[]"
+    else:
+        yield _encode_any(value)
+        return
+    if not value:
+        yield brackets
+        return
+    if indent is None:
+        separator, colon, closing_ = ",", ":", brackets[1]
+    else:
+        separator = ",\n" + " " * (indent * (level + 1))
+        colon, closing_ = ": ", "\n" + " " * (indent * level) + brackets[1]
+    yield brackets[0] + separator[1:]
+    for position, (key, item) in enumerate(items):
+        if position:
+            yield separator
+        if key is not None:
+            yield _encode_str(str(key)) + colon
+        yield from iter_json(item, indent, level + 1)
+    yield closing_
+
+
+class _Inverted:
+    __slots__ = ("key",)
+
+    def __init__(self, key: Any) -> None:
+        self.key = key
+
+    def __lt__(self, other: _Inverted) -> bool:
+        return other.key < self.key
+
+
+class TopK(Generic[T]):
+    """Keep the ``k`` items with the smallest ``key`` out of a stream.
+
+    Uses a bounded heap whose root is the worst kept item, so each ``push`` is
+    O(log k) and memory is O(k). Items with equal keys keep arrival order.
+    """
+
+    def __init__(self, k: int, key: Callable[[T], Any] | None = None) -> None:
+        self.k = k
+        self.seen = 0
+        self._key = key
+        self._heap: list[tuple[_Inverted, T]] = []
+
+    def push(self, item: T) -> None:
+        self.seen += 1
+        if self.k <= 0:
+            return
+        rank = (self._key(item) if self._key else 0, self.seen)
+        entry = (_Inverted(rank), item)
+        if len(self._heap) < self.k:
+            heapq.heappush(self._heap, entry)
+        elif self._heap[0][0].key > rank:
+            heapq.heapreplace(self._heap, entry)
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    def items(self) -> list[T]:
+        return [item for _, item in sorted(self._heap, key=lambda e: e[0].key)]
+
+
+class JsonStream:
+    """Pull reader that decodes a JSON document one value at a time.
+
+    Containers are walked with ``items()``/``elements()``; after each yield the
+    caller must consume exactly one value, either with ``value()`` or by walking
+    it further. Only the value being decoded is held in memory.
+
+    Under ``PARTIAL_ARTIFACTS`` a document cut off mid-value is treated as if
+    every open container closed there: the cut value reads as ``None`` and the
+    walk ends, so callers keep everything decoded before it.
+    """
+
+    def __init__(self, source: BinaryIO, chunk_size: int = JSON_CHUNK_SIZE) -> None:
+        self._source = source
+        self._chunk_size = chunk_size
+        self._decoder = codecs.getincrementaldecoder("utf-8-sig")()
+        self._json = json.JSONDecoder()
+        self._buf = ""
+        self._pos = 0
+        self._eof = False
+        self._partial = PARTIAL_ARTIFACTS.get()
+        self.truncated = False
+
+    def _truncate(self) -> None:
+        if not self.truncated:
+            print("builder: artifact ends mid-value; keeping what was read", file=sys.stderr)
+        self.truncated = True
+        self._buf, self._pos = "", 0
+
+    def _fill(self) -> bool:
+        if self._eof:
+            return False
+        pending = len(self._buf) - self._pos
+        chunk = self._source.read(max(self._chunk_size, pending))
+        if not chunk:
+            self._eof = True
+        text = self._decoder.decode(chunk, final=self._eof)
+        self._buf = self._buf[self._pos :] + text
+        self._pos = 0
+        return True
+
+    def peek(self) -> str:
+        """Return the next non-whitespace character, or ``""`` at end of input."""
+        while True:
+            self._pos = _WHITESPACE.match(self._buf, self._pos).end()  # type: ignore[union-attr]
+            if self._pos < len(self._buf):
+                return self._buf[self._pos]
+            if not self._fill():
+                return ""
+
+    def _expect(self, char: str) -> None:
+        found = self.peek()
+        if found == "" and self._partial:
+            self._truncate()
+            return
+        if found != char:
+            raise json.JSONDecodeError(f"Expected {char!r}, found {found!r}", self._buf, self._pos)
+        self._pos += 1
+
+    def value(self) -> Any:
+        self.peek()
+        while True:
+            try:
+                obj, end = self._json.raw_decode(self._buf, self._pos)
+            except json.JSONDecodeError:
+                if self._fill():
+                    continue
+                if self._partial:
+                    self._truncate()
+                    return None
+                raise
+            # A number cut by the chunk edge decodes as its prefix ("1" of "1.5e3"):
+            # read on while it ends at, or just before a continuation of, the edge.
+            if (
+                isinstance(obj, int | float)
+                and (end == len(self._buf) or self._buf[end] in _NUMBER_CONTINUATION)
+                and self._fill()
+            ):
+                continue
+            self._pos = end
+            return obj
+
+    def values(self) -> Iterator[Any]:
+        """Yield consecutive top-level values (JSON Lines / concatenated JSON)."""
+        while self.peek():
+            yield self.value()
+
+    def _separator(self, closing: str) -> bool:
+        found = self.peek()
+        if found == "" and self._partial:
+            self._truncate()
+            return False
+        self._pos += 1
+        if found == closing:
+            return False
+        if found != ",":
+            raise json.JSONDecodeError(f"Expected ',' or {closing!r}", self._buf, self._pos - 1)
+        return True
+
+    def elements(self) -> Iterator[None]:
+        self._expect("[")
+        if self.truncated:
+            return
+        if self.peek() == "]":
+            self._pos += 1
+            return
+        while True:
+            yield
+            if not self._separator("]"):
+                return
+
+    def items(self) -> Iterator[str]:
+        self._expect("{")
+        if self.truncated:
+            return
+        if self.peek() == "}":
+            self._pos += 1
+            return
+        while True:
+            key = self.value()
+            self._expect(":")
+            yield key
+            if not self._separator("}"):
+                return
+
+
+ARTIFACT_STATS: list[ArtifactStat] = []
+
+
+class ArtifactReader:
+    """Binary reader over an artifact that counts the bytes handed out."""
+
+    def __init__(self, source: Any, mode: str, chunk_size: int) -> None:
+        self._source = source
+        self.mode = mode
+        self.chunk_size = chunk_size
+        self.bytes_read = 0
+
+    def read(self, size: int = -1) -> bytes:
+        data = self._source.read(size)
+        self.bytes_read += len(data)
+        return data
+
+
+@contextmanager
+def open_artifact(path: str, name: str) -> Iterator[ArtifactReader | None]:
+    """Stat ``path`` once and open it with the cheapest strategy for its size.
+
+    Small files are read in a single call, larger ones are mapped with mmap and
+    very large ones are streamed in chunks. gzip and zstd files (such as
+    compressed summaries used as a baseline) are decompressed while streaming.
+    Yields ``None`` for missing or empty files. Bytes read and elapsed time are
+    recorded in ``ARTIFACT_STATS``.
+    """
+    started = time.perf_counter()
+    reader: ArtifactReader | None = None
+    try:
+        size = Path(path).stat().st_size
+    except FileNotFoundError:
+        size, mode = 0, "missing"
+    else:
+        mode = "empty" if size == 0 else ""
+
+    try:
+        if mode:
+            yield None
+            return
+        with open(path, "rb") as fh:
+            head = fh.read(len(ZSTD_MAGIC))
+            fh.seek(0)
+            if head.startswith(GZIP_MAGIC):
+                with gzip.GzipFile(fileobj=fh, mode="rb") as unpacked:
+                    reader = ArtifactReader(unpacked, "gzip", JSON_CHUNK_SIZE)
+                    yield reader
+            elif head == ZSTD_MAGIC:
+                with _zstandard().ZstdDecompressor().stream_reader(fh) as unpacked:
+                    reader = ArtifactReader(unpacked, "zstd", JSON_CHUNK_SIZE)
+                    yield reader
+            elif size <= SMALL_ARTIFACT_BYTES:
+                reader = ArtifactReader(io.BytesIO(fh.read()), "memory", size)
+                yield reader
+            elif size <= STREAM_ARTIFACT_BYTES:
+                with mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                    reader = ArtifactReader(mapped, "mmap", MMAP_CHUNK_SIZE)
+                    yield reader
+            else:
+                reader = ArtifactReader(fh, "stream", JSON_CHUNK_SIZE)
+                yield reader
+    finally:
+        ARTIFACT_STATS.append(
+            ArtifactStat(
+                name=name,
+                path=path,
+                mode=reader.mode if reader else mode,
+                size=size,
+                bytes_read=reader.bytes_read if reader else 0,
+                seconds=round(time.perf_counter() - started, 4),
+            )
         )
-    return errors, warnings, normalized
 
 
-def parse_junit(path: str) -> tuple[int, int, int, list[FailedTest]]:
+@contextmanager
+def open_json_stream(path: str, name: str) -> Iterator[JsonStream | None]:
+    """Open ``path`` as a ``JsonStream``; yields ``None`` for missing or blank files."""
+    with open_artifact(path, name) as reader:
+        if reader is None:
+            yield None
+            return
+        stream = JsonStream(reader, chunk_size=reader.chunk_size)
+        yield stream if stream.peek() else None
+
+
+def iter_xml(source: BinaryIO, events: tuple[str, ...]) -> Iterator[tuple[str, ET.Element]]:
+    """``ElementTree.iterparse`` that, under ``PARTIAL_ARTIFACTS``, stops at a truncated tail."""
+    import xml.etree.ElementTree as ET
+
+    try:
+        yield from ET.iterparse(source, events=events)
+    except ET.ParseError:
+        if not PARTIAL_ARTIFACTS.get():
+            raise
+        print("builder: XML artifact ends early; keeping what was read", file=sys.stderr)
+
+
+@lru_cache(maxsize=8192)
+def normalize_path(path: str) -> str:
+    # Cached: findings repeat the same few files, and each call may hit the cwd.
+    if not path:
+        return ""
     p = Path(path)
-    if not p.exists():
-        return 0, 0, 0, []
+    if p.is_absolute():
+        try:
+            p = p.relative_to(Path.cwd())
+        except ValueError:
+            pass
+    return p.as_posix()
+
+
+def fingerprint(path: str, rule: str, message: str) -> str:
+    raw = "\0".join((normalize_path(path), rule, " ".join(message.split())))
+    return hashlib.blake2b(raw.encode("utf-8"), digest_size=8).hexdigest()
+
+
+def finding_fingerprint(tool: str, item: dict[str, Any]) -> str:
+    path, rule, message = (str(item.get(field) or "") for field in FINGERPRINT_FIELDS[tool])
+    return fingerprint(path, rule, message)
+
+
+def load_baseline(path: str | None, tool: str) -> Counter[str] | None:
+    """Load the fingerprint multiset for ``tool`` from a previous quality_summary.json."""
+    if not path:
+        return None
+    known: Counter[str] = Counter()
+    samples: list[dict[str, Any]] = []
+    with open_json_stream(path, f"baseline-{tool}") as stream:
+        if stream is None or stream.peek() != "{":
+            return known
+        for key in stream.items():
+            if key == "fingerprints" and stream.peek() == "{":
+                for name in stream.items():
+                    fingerprints = stream.value()
+                    if name == tool:
+                        known.update(fingerprints or [])
+                        return known
+            elif key == "checks":
+                check = (stream.value() or {}).get(tool) or {}
+                samples = check.get(BASELINE_SAMPLE_KEYS[tool]) or []
+            else:
+                stream.value()
+    known.update(finding_fingerprint(tool, item) for item in samples if isinstance(item, dict))
+    return known
+
+
+class BaselineFilter:
+    """Split findings into new ones and ones already present in the baseline.
+
+    Fingerprints are a multiset, so a finding duplicated on the branch is still
+    reported once the baseline copies are used up. Every fingerprint seen is
+    recorded so the current summary can serve as the next baseline.
+    """
+
+    def __init__(self, tool: str, baseline: str | None) -> None:
+        self.tool = tool
+        self._known = load_baseline(baseline, tool)
+        self.match = BaselineMatch(fingerprints=[])
+
+    def is_new(self, item: dict[str, Any]) -> bool:
+        fp = finding_fingerprint(self.tool, item)
+        self.match.fingerprints.append(fp)
+        if self._known and self._known[fp] > 0:
+            self._known[fp] -= 1
+            self.match.known += 1
+            return False
+        return True
+
+
+class FindingSink:
+    """Append every parsed record to an NDJSON file, one line each, as it is seen.
+
+    Unlike the report sections nothing is capped here; records are written
+    straight through, so memory use does not depend on how many there are.
+    """
+
+    def __init__(self, path: str) -> None:
+        self._fh = open(path, "w", encoding="utf-8")
+        self._encode = json.JSONEncoder(ensure_ascii=False, separators=(",", ":")).encode
+
+    def write(self, tool: str, record: Any, extra: dict[str, Any]) -> None:
+        if isinstance(record, dict):
+            self._fh.write(self._encode({"tool": tool, **extra, **record}))
+        else:
+            self._fh.write(encode_record(record, tool=tool, **extra))
+        self._fh.write("\n")
+
+    def close(self) -> None:
+        self._fh.close()
+
+
+def _sarif_ruff(record: dict[str, Any]) -> tuple[dict[str, Any], dict[str, Any]]:
+    code = record.get("code") or "syntax-error"
+    location = record.get("location") or {}
+    rule = {"id": code, "name": code}
+    if record.get("url"):
+        rule["helpUri"] = record["url"]
+    region = {"startLine": location.get("row") or 1, "startColumn": location.get("column") or 1}
+    return rule, {
+        "level": "error",
+        "message": record.get("message") or "",
+        "file": record.get("filename") or "",
+        "region": region,
+    }
+
+
+def _sarif_pyright(record: dict[str, Any]) -> tuple[dict[str, Any], dict[str, Any]]:
+    rule_id = record.get("rule") or "pyright"
+    return {"id": rule_id, "name": rule_id}, {
+        "level": SARIF_LEVELS.get(record.get("severity") or "", "note"),
+        "message": record.get("message") or "",
+        "file": record.get("file") or "",
+        "region": {"startLine": record.get("line") or 1},
+    }
+
+
+def _sarif_bandit(record: dict[str, Any]) -> tuple[dict[str, Any], dict[str, Any]]:
+    rule = {"id": record.get("test_id") or "bandit", "name": record.get("test_name") or ""}
+    return rule, {
+        "level": SARIF_LEVELS.get(str(record.get("severity") or "").lower(), "note"),
+        "message": record.get("issue_text") or "",
+        "file": record.get("filename") or "",
+        "region": {"startLine": record.get("line_number") or 1},
+    }
+
+
+SARIF_TOOLS: dict[str, tuple[str, Callable[..., tuple[dict[str, Any], dict[str, Any]]]]] = {
+    "ruff": ("https://docs.astral.sh/ruff/", _sarif_ruff),
+    "pyright": ("https://github.com/microsoft/pyright", _sarif_pyright),
+    "bandit": ("https://bandit.readthedocs.io/", _sarif_bandit),
+}
+
+
+def _sarif_driver(tool: str, rules: list[dict[str, Any]]) -> dict[str, Any]:
+    return {"driver": {"name": tool, "informationUri": SARIF_TOOLS[tool][0], "rules": rules}}
+
+
+class _SarifRun:
+    """One tool's SARIF run, written to ``<sarif>.<tool>.part`` result by result.
+
+    Results are written first and the driver last, since JSON member order is
+    free: only the per-tool rule index (rule id -> position) is kept in memory.
+    """
+
+    def __init__(self, path: str, tool: str) -> None:
+        self.tool = tool
+        self._fh = open(path, "w", encoding="utf-8")
+        self._fh.write('{"results":[')
+        self._rule_index: dict[str, int] = {}
+        self._rules: list[dict[str, Any]] = []
+        self._encode = json.JSONEncoder(ensure_ascii=False, separators=(",", ":")).encode
+        self.results = 0
+
+    def write(self, record: dict[str, Any]) -> None:
+        rule, result = SARIF_TOOLS[self.tool][1](record)
+        index = self._rule_index.get(rule["id"])
+        if index is None:
+            index = self._rule_index[rule["id"]] = len(self._rules)
+            self._rules.append(rule)
+        artifact = {"uri": normalize_path(result["file"]), "uriBaseId": "%SRCROOT%"}
+        location = {"physicalLocation": {"artifactLocation": artifact, "region": result["region"]}}
+        sarif_result = {
+            "ruleId": rule["id"],
+            "ruleIndex": index,
+            "level": result["level"],
+            "message": {"text": result["message"]},
+            "locations": [location],
+            "partialFingerprints": {"loomFingerprint/v1": finding_fingerprint(self.tool, record)},
+            "baselineState": "new" if record.get("new", True) else "unchanged",
+        }
+        if self.results:
+            self._fh.write(",")
+        self._fh.write(self._encode(sarif_result))
+        self.results += 1
+
+    def close(self) -> None:
+        self._fh.write('],"tool":')
+        self._fh.write(self._encode(_sarif_driver(self.tool, self._rules)))
+        self._fh.write("}")
+        self._fh.close()
+
+
+class SarifSink:
+    """Stream ruff, pyright and bandit records into per-tool SARIF runs.
+
+    Each run goes to its own part file next to ``path``, so parallel parse
+    tasks never share one; ``write_sarif`` stitches them into the document.
+    """
+
+    def __init__(self, path: str) -> None:
+        self._path = path
+        self._runs: dict[str, _SarifRun] = {}
+
+    def write(self, tool: str, record: Any, extra: dict[str, Any]) -> None:
+        if tool not in SARIF_TOOLS:
+            return
+        if not isinstance(record, dict):
+            record = record_fields(record)
+        if extra:
+            record = {**extra, **record}
+        run = self._runs.get(tool)
+        if run is None:
+            run = self._runs[tool] = _SarifRun(f"{self._path}.{tool}.part", tool)
+        run.write(record)
+
+    def close(self) -> None:
+        for run in self._runs.values():
+            run.close()
+
+
+def write_sarif(path: str) -> None:
+    """Assemble the SARIF 2.1.0 document from the run parts ``SarifSink`` wrote.
+
+    Every tool gets a run, an empty one when it reported nothing, so code
+    scanning can close alerts that were fixed.
+    """
+    with open(path, "wb") as out:
+        out.write(f'{{"$schema":"{SARIF_SCHEMA}","version":"2.1.0","runs":['.encode())
+        for position, tool in enumerate(SARIF_TOOLS):
+            if position:
+                out.write(b",")
+            part = f"{path}.{tool}.part"
+            if os.path.exists(part):
+                with open(part, "rb") as fh:
+                    shutil.copyfileobj(fh, out)
+                os.remove(part)
+            else:
+                empty = {"results": [], "tool": _sarif_driver(tool, [])}
+                out.write(json.dumps(empty, separators=(",", ":")).encode())
+        out.write(b"]}")
+
+
+# Set while parsing when --findings-ndjson or --sarif is given; per worker process.
+SINKS: list[FindingSink | SarifSink] = []
+
+
+def emit(tool: str, record: Any, **extra: Any) -> None:
+    """Pass a finding (a dict or a record dataclass) to the active sinks.
+
+    Records are only encoded by the sinks, so nothing is built when none is active.
+    """
+    for sink in SINKS:
+        sink.write(tool, record, extra)
+
+
+@contextmanager
+def record_sinks(ndjson_path: str | None, sarif_path: str | None) -> Iterator[None]:
+    if ndjson_path:
+        SINKS.append(FindingSink(ndjson_path))
+    if sarif_path:
+        SINKS.append(SarifSink(sarif_path))
+    try:
+        yield
+    finally:
+        while SINKS:
+            SINKS.pop().close()
+
+
+def parse_ruff(
+    path: str, limit: int = MAX_ITEMS, baseline: str | None = None
+) -> tuple[int, list[dict[str, Any]], list[tuple[str, int]], BaselineMatch]:
+    sample: TopK[dict[str, Any]] = TopK(limit)
+    per_file: Counter[str] = Counter()
+    seen = BaselineFilter("ruff", baseline)
+    with open_json_stream(path, "ruff") as stream:
+        if stream is None:
+            return 0, [], [], seen.match
+        # `--output-format json` writes one array; `json-lines` one finding per line.
+        if stream.peek() == "[":
+            findings = (stream.value() for _ in stream.elements())
+        else:
+            findings = stream.values()
+        for item in findings:
+            if not isinstance(item, dict):
+                continue
+            new = seen.is_new(item)
+            emit("ruff", item, new=new)
+            if not new:
+                continue
+            sample.push(item)
+            per_file[item.get("filename") or ""] += 1
 
-    root = ET.parse(p).getroot()
-    suites = [root] if root.tag == "testsuite" else list(root.findall("testsuite"))
+    top_files: TopK[tuple[str, int]] = TopK(limit, key=lambda fc: -fc[1])
+    for file_count in per_file.items():
+        top_files.push(file_count)
+    return sample.seen, sample.items(), top_files.items(), seen.match
 
+
+def _normalize_pyright(d: dict[str, Any]) -> dict[str, Any]:
+    rng = d.get("range") or {}
+    start = rng.get("start") or {}
+    return {
+        "file": d.get("file") or "",
+        "line": int(start.get("line", 0) or 0) + 1,
+        "severity": d.get("severity") or "",
+        "rule": d.get("rule") or "",
+        "message": d.get("message") or "",
+    }
+
+
+def parse_pyright(
+    path: str, limit: int = MAX_ITEMS, baseline: str | None = None
+) -> tuple[int, int, list[dict[str, Any]], BaselineMatch]:
+    summary: dict[str, Any] = {}
+    new_counts: Counter[str] = Counter()
+    seen = BaselineFilter("pyright", baseline)
+    normalized: TopK[dict[str, Any]] = TopK(
+        limit, key=lambda d: PYRIGHT_SEVERITY_ORDER.get(d["severity"], len(PYRIGHT_SEVERITY_ORDER))
+    )
+    with open_json_stream(path, "pyright") as stream:
+        if stream is None or stream.peek() != "{":
+            return 0, 0, [], seen.match
+        for key in stream.items():
+            if key == "generalDiagnostics" and stream.peek() == "[":
+                for _ in stream.elements():
+                    d = stream.value()
+                    if not isinstance(d, dict):
+                        continue
+                    diagnostic = _normalize_pyright(d)
+                    new = seen.is_new(diagnostic)
+                    emit("pyright", diagnostic, new=new)
+                    if new:
+                        new_counts[diagnostic["severity"]] += 1
+                        normalized.push(diagnostic)
+            elif key == "summary":
+                summary = stream.value() or {}
+            else:
+                stream.value()
+
+    # The summary comes last, so a truncated report falls back to the diagnostics read.
+    if baseline or not summary:
+        errors, warnings = new_counts["error"], new_counts["warning"]
+    else:
+        errors = int(summary.get("errorCount", 0) or 0)
+        warnings = int(summary.get("warningCount", 0) or 0)
+    return errors, warnings, normalized.items(), seen.match
+
+
+def parse_junit(path: str, limit: int = MAX_ITEMS) -> tuple[int, int, int, list[FailedTest]]:
+    tests = failures = skipped = 0
+    # Recounted from the testcases themselves, for merged or per-worker reports
+    # whose suites carry no counters.
+    case_tests = case_failures = case_skipped = 0
+    failed_tests: list[FailedTest] = []
+
+    # Stream the document instead of building the whole tree: suite counters are
+    # read from start tags, each testcase is dropped once handled and captured
+    # output is discarded as soon as it closes, so memory stays flat.
+    stack: list[ET.Element] = []
+    with open_artifact(path, "junit") as reader:
+        if reader is None:
+            return 0, 0, 0, []
+        for event, elem in iter_xml(reader, ("start", "end")):
+            if event == "start":
+                stack.append(elem)
+                if elem.tag == "testsuite" and len(stack) <= 2:
+                    tests += int(elem.attrib.get("tests", 0) or 0)
+                    failures += int(elem.attrib.get("failures", 0) or 0) + int(
+                        elem.attrib.get("errors", 0) or 0
+                    )
+                    skipped += int(elem.attrib.get("skipped", 0) or 0)
+                continue
+
+            stack.pop()
+            if elem.tag in {"system-out", "system-err"}:
+                elem.clear()
+            elif elem.tag == "testcase":
+                case_tests += 1
+                outcomes = {node.tag for node in elem}
+                case_failures += bool(outcomes & {"failure", "error"})
+                case_skipped += "skipped" in outcomes
+                if len(failed_tests) < limit or SINKS:
+                    for node in elem:
+                        if node.tag not in {"failure", "error"}:
+                            continue
+                        file_ = elem.attrib.get("file") or ""
+                        classname = elem.attrib.get("classname") or ""
+                        name = elem.attrib.get("name") or ""
+                        nodeid = f"{file_}::{name}" if file_ else f"{classname}::{name}"
+                        message = (node.attrib.get("message") or (node.text or "")).strip()
+                        failed = FailedTest(nodeid=nodeid, message=message)
+                        emit("pytest", failed)
+                        if len(failed_tests) < limit:
+                            failed_tests.append(failed)
+                elem.clear()
+                if stack:
+                    stack[-1].remove(elem)
+
+    if tests == 0 and case_tests > 0:
+        tests, failures, skipped = case_tests, case_failures, case_skipped
+    return tests, failures, skipped, failed_tests[:limit]
+
+
+def parse_coverage(
+    path: str, threshold: float = 100.0, limit: int = MAX_ITEMS
+) -> tuple[float, list[CoverageFile]]:
+    """Return global coverage and the ``limit`` least covered files below ``threshold``."""
+    total = 0.0
+    below: TopK[CoverageFile] = TopK(limit, key=lambda f: f.percent)
+    with open_json_stream(path, "coverage") as stream:
+        if stream is None or stream.peek() != "{":
+            return 0.0, []
+        for key in stream.items():
+            if key == "totals":
+                totals = stream.value() or {}
+                total = round(float(totals.get("percent_covered", 0.0) or 0.0), 2)
+            elif key == "files" and stream.peek() == "{":
+                for fp in stream.items():
+                    info = stream.value() or {}
+                    summary = info.get("summary", {}) or {}
+                    pct = round(float(summary.get("percent_covered", 0.0) or 0.0), 2)
+                    if pct >= threshold and not SINKS:
+                        continue
+                    missing = compress_line_ranges(info.get("missing_lines", []) or [])
+                    record = CoverageFile(path=fp, percent=pct, missing_ranges=missing)
+                    emit("coverage", record)
+                    if pct < threshold:
+                        below.push(record)
+            else:
+                stream.value()
+
+    return total, below.items()
+
+
+def parse_junit_files(
+    paths: list[str], limit: int = MAX_ITEMS
+) -> tuple[int, int, int, list[FailedTest]]:
+    """Sum the counters of sharded junit reports and keep the first ``limit`` failures."""
+    if len(paths) == 1:
+        return parse_junit(paths[0], limit)
     tests = failures = skipped = 0
     failed_tests: list[FailedTest] = []
+    for path in paths:
+        t, f, s, failed = parse_junit(path, limit - len(failed_tests))
+        tests += t
+        failures += f
+        skipped += s
+        failed_tests.extend(failed)
+    return tests, failures, skipped, failed_tests
+
+
+def sniff_coverage_format(path: str) -> str:
+    """Tell coverage.json, Cobertura XML and lcov apart by extension, then by content."""
+    suffix = Path(path).suffix.lower()
+    if suffix in COVERAGE_SUFFIXES:
+        return COVERAGE_SUFFIXES[suffix]
+    try:
+        with open(path, "rb") as fh:
+            head = fh.read(512).lstrip(b"\xef\xbb\xbf \t\r\n")
+    except OSError:
+        return "json"
+    if head.startswith(SQLITE_HEADER):
+        return "sqlite"
+    if head.startswith(b"<"):
+        return "cobertura"
+    if head.startswith((b"TN:", b"SF:")):
+        return "lcov"
+    return "json"
+
+
+def _iter_lines(reader: ArtifactReader) -> Iterator[str]:
+    """Yield decoded lines from an artifact, one chunk in memory at a time."""
+    decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+    pending = ""
+    while chunk := reader.read(reader.chunk_size):
+        pending += decoder.decode(chunk)
+        *lines, pending = pending.split("\n")
+        yield from lines
+    pending += decoder.decode(b"", final=True)
+    if pending:
+        yield pending
+
+
+def _relative_path(path: str) -> str:
+    if os.path.isabs(path):
+        relative = os.path.relpath(path)
+        if not relative.startswith(".."):
+            path = relative
+    return normalize_path(path)
+
+
+def _coverage_json_lines(path: str) -> Iterator[tuple[str, list[int], list[int]]]:
+    """Yield ``(file, executed_lines, missing_lines)`` from a coverage.json report."""
+    with open_json_stream(path, "coverage") as stream:
+        if stream is None or stream.peek() != "{":
+            return
+        for key in stream.items():
+            if key != "files" or stream.peek() != "{":
+                stream.value()
+                continue
+            for fp in stream.items():
+                info = stream.value() or {}
+                yield fp, info.get("executed_lines") or [], info.get("missing_lines") or []
+
+
+def _cobertura_lines(path: str) -> Iterator[tuple[str, list[int], list[int]]]:
+    """Yield ``(file, executed_lines, missing_lines)`` per ``<class>`` of a Cobertura report.
+
+    Files are made relative to the working directory through the report's
+    ``<source>`` roots, so they match coverage.json paths. With several roots,
+    each file is resolved against the first root it exists under. Each class is
+    cleared once read; a file split over several classes is combined by the caller.
+    """
+    sources: list[str] = []
+    resolved: dict[str, str] = {}
+    with open_artifact(path, "coverage") as reader:
+        if reader is None:
+            return
+        for _, elem in iter_xml(reader, ("end",)):
+            if elem.tag == "source" and elem.text:
+                sources.append(elem.text.strip())
+            elif elem.tag == "class":
+                executed: list[int] = []
+                missing: list[int] = []
+                for line in elem.iterfind("lines/line"):
+                    number = int(line.attrib.get("number", 0))
+                    (executed if int(line.attrib.get("hits", 0) or 0) else missing).append(number)
+                filename = elem.attrib.get("filename") or ""
+                if filename not in resolved:
+                    resolved[filename] = _cobertura_file(sources, filename)
+                yield resolved[filename], executed, missing
+                elem.clear()
+
+
+def _cobertura_file(sources: list[str], filename: str) -> str:
+    candidates = [os.path.join(source, filename) for source in sources]
+    for candidate in candidates:
+        if os.path.exists(candidate):
+            return _relative_path(candidate)
+    # Nothing on disk (e.g. a report from another checkout): keep the single root.
+    return _relative_path(candidates[0] if len(candidates) == 1 else filename)
+
+
+def _lcov_lines(path: str) -> Iterator[tuple[str, list[int], list[int]]]:
+    """Yield ``(file, executed_lines, missing_lines)`` per ``SF:`` record of an lcov report."""
+    with open_artifact(path, "coverage") as reader:
+        if reader is None:
+            return
+        filename = ""
+        executed: list[int] = []
+        missing: list[int] = []
+        for raw in _iter_lines(reader):
+            line = raw.strip()
+            if line.startswith("SF:"):
+                filename, executed, missing = _relative_path(line[3:]), [], []
+            elif line.startswith("DA:"):
+                number, _, rest = line[3:].partition(",")
+                hits = rest.split(",", 1)[0]
+                (executed if hits not in {"0", ""} else missing).append(int(number))
+            elif line == "end_of_record" and filename:
+                yield filename, executed, missing
+                filename = ""
+
+
+def _statement_parser() -> Callable[[str], Any | None]:
+    """Return a loader of coverage.py's ``PythonParser`` for a source file.
+
+    Exclusion patterns come from the project's coverage configuration, as
+    they would for ``coverage json``. Files that cannot be read or are not
+    Python yield ``None``.
+    """
+    import coverage
+    from coverage.exceptions import CoverageException
+    from coverage.parser import PythonParser
+
+    exclude_list = coverage.Coverage(data_file=None).config.exclude_list
+    exclude = "|".join(f"(?:{regex})" for regex in exclude_list)
 
-    for suite in suites:
-        tests += int(suite.attrib.get("tests", 0) or 0)
-        failures += int(suite.attrib.get("failures", 0) or 0) + int(
-            suite.attrib.get("errors", 0) or 0
+    def load(path: str) -> Any | None:
+        try:
+            parser = PythonParser(filename=path, exclude=exclude or None)
+            parser.parse_source()
+        except (OSError, CoverageException):
+            return None
+        return parser
+
+    return load
+
+
+def _coverage_sqlite_lines(path: str) -> Iterator[tuple[str, list[int], list[int]]]:
+    """Yield ``(file, executed_lines, missing_lines)`` from a ``.coverage`` data file.
+
+    Executed lines come straight from the database: the ``numbits`` blobs of
+    ``line_bits`` (one bit per line, OR-ed across contexts) or, for branch
+    data, the distinct arc endpoints. Statements come from parsing each source
+    file, so no ``coverage json`` export is needed. Every file in the ``file``
+    table is reported, including ones that were measured but never imported.
+    """
+    import sqlite3
+
+    started = time.perf_counter()
+    size = Path(path).stat().st_size if Path(path).exists() else 0
+    executed: dict[str, int] = {}
+    if size:
+        uri = Path(path).resolve().as_uri() + "?mode=ro"
+        with closing(sqlite3.connect(uri, uri=True)) as db:
+            executed = {fp: 0 for (fp,) in db.execute("SELECT path FROM file ORDER BY id")}
+            for fp, numbits in db.execute(
+                "SELECT file.path, line_bits.numbits FROM line_bits"
+                " JOIN file ON file.id = line_bits.file_id"
+            ):
+                executed[fp] = executed.get(fp, 0) | int.from_bytes(numbits, "little")
+            for fp, lines in db.execute(
+                "SELECT file.path, group_concat(line) FROM ("
+                " SELECT file_id, fromno AS line FROM arc WHERE fromno > 0"
+                " UNION SELECT file_id, tono FROM arc WHERE tono > 0"
+                ") JOIN file ON file.id = file_id GROUP BY file.path"
+            ):
+                executed[fp] = executed.get(fp, 0) | line_mask(map(int, lines.split(",")))
+    ARTIFACT_STATS.append(
+        ArtifactStat(
+            name="coverage",
+            path=path,
+            mode="sqlite" if size else "missing",
+            size=size,
+            bytes_read=size,
+            seconds=round(time.perf_counter() - started, 4),
         )
-        skipped += int(suite.attrib.get("skipped", 0) or 0)
+    )
+    if not executed:
+        return
+
+    load_parser = _statement_parser()
+    for fp, mask in executed.items():
+        parser = load_parser(fp)
+        if parser is None:
+            continue
+        ran = parser.translate_lines(mask_lines(mask)) & parser.statements
+        yield _relative_path(fp), sorted(ran), sorted(parser.statements - ran)
+
 
-        for case in suite.iter("testcase"):
-            for node in list(case.findall("failure")) + list(case.findall("error")):
-                file_ = case.attrib.get("file") or ""
-                classname = case.attrib.get("classname") or ""
-                name = case.attrib.get("name") or ""
-                nodeid = f"{file_}::{name}" if file_ else f"{classname}::{name}"
-                message = (node.attrib.get("message") or (node.text or "")).strip()
-                failed_tests.append(FailedTest(nodeid=nodeid, message=message))
+COVERAGE_LINE_READERS: dict[str, Callable[[str], Iterator[tuple[str, list[int], list[int]]]]] = {
+    "json": _coverage_json_lines,
+    "cobertura": _cobertura_lines,
+    "lcov": _lcov_lines,
+    "sqlite": _coverage_sqlite_lines,
+}
 
-    return tests, failures, skipped, failed_tests[:MAX_ITEMS]
 
+def parse_coverage_files(
+    paths: list[str], threshold: float = 100.0, limit: int = MAX_ITEMS
+) -> tuple[float, list[CoverageFile]]:
+    """Merge coverage reports and recompute per-file and global coverage.
 
-def parse_coverage(path: str) -> tuple[float, list[CoverageFile]]:
-    data = read_json(path)
-    if not isinstance(data, dict):
+    Each report may be coverage.json, Cobertura XML, lcov or a ``.coverage``
+    data file (see
+    ``sniff_coverage_format``). A line counts as covered when any report executed
+    it. Statements and executed lines are kept per file as int bitmaps, so unions
+    stay cheap for large trees. Percentages are line-based; branch data is not
+    merged. A single coverage.json keeps the fast path through ``parse_coverage``.
+    """
+    formats = [sniff_coverage_format(path) for path in paths]
+    if formats == ["json"]:
+        return parse_coverage(paths[0], threshold, limit)
+    statements: dict[str, int] = {}
+    executed: dict[str, int] = {}
+    for path, fmt in zip(paths, formats, strict=True):
+        for fp, executed_lines, missing_lines in COVERAGE_LINE_READERS[fmt](path):
+            ran = line_mask(executed_lines)
+            statements[fp] = statements.get(fp, 0) | ran | line_mask(missing_lines)
+            executed[fp] = executed.get(fp, 0) | ran
+    if not statements:
         return 0.0, []
 
-    total = round(float((data.get("totals", {}) or {}).get("percent_covered", 0.0)), 2)
-    files: list[CoverageFile] = []
-
-    for fp, info in (data.get("files", {}) or {}).items():
-        summary = info.get("summary", {}) or {}
-        pct = round(float(summary.get("percent_covered", 0.0) or 0.0), 2)
-        missing = info.get("missing_lines", []) or []
-        files.append(CoverageFile(path=fp, percent=pct, missing_lines=missing))
-
-    return total, files
-
-
-def parse_bandit(path: str, fail_on: str) -> tuple[list[BanditIssue], bool]:
-    data = read_json(path)
-    if not isinstance(data, dict):
-        return [], False
-
-    issues: list[BanditIssue] = []
-    for i in (data.get("results", []) or [])[:MAX_ITEMS]:
-        issues.append(
-            BanditIssue(
-                filename=i.get("filename", ""),
-                line_number=int(i.get("line_number", 0) or 0),
-                severity=str(i.get("issue_severity", "LOW")),
-                confidence=str(i.get("issue_confidence", "LOW")),
-                test_id=i.get("test_id", ""),
-                test_name=i.get("test_name", ""),
-                issue_text=(i.get("issue_text", "") or "").strip(),
-            )
-        )
+    total_statements = total_executed = 0
+    below: TopK[CoverageFile] = TopK(limit, key=lambda f: f.percent)
+    for fp, stmts in statements.items():
+        ran = executed[fp] & stmts
+        n_statements = stmts.bit_count()
+        n_executed = ran.bit_count()
+        total_statements += n_statements
+        total_executed += n_executed
+        pct = round(100.0 * n_executed / n_statements, 2) if n_statements else 100.0
+        if pct >= threshold and not SINKS:
+            continue
+        missing = compress_line_ranges(mask_lines(stmts & ~ran))
+        record = CoverageFile(path=fp, percent=pct, missing_ranges=missing)
+        emit("coverage", record)
+        if pct < threshold:
+            below.push(record)
+    total = round(100.0 * total_executed / total_statements, 2) if total_statements else 100.0
+    return total, below.items()
 
+
+def parse_bandit(
+    path: str, fail_on: str, limit: int = MAX_ITEMS, baseline: str | None = None
+) -> tuple[int, list[BanditIssue], bool, BaselineMatch]:
     threshold = SEVERITY_ORDER.get(fail_on, 0)
-    blocking = (
-        any(SEVERITY_ORDER.get(i.severity.lower(), 0) >= threshold for i in issues)
-        if threshold > 0
-        else False
+    seen = BaselineFilter("bandit", baseline)
+    blocking = False
+    issues: TopK[BanditIssue] = TopK(
+        limit,
+        key=lambda i: (
+            -SEVERITY_ORDER.get(i.severity.lower(), 0),
+            -SEVERITY_ORDER.get(i.confidence.lower(), 0),
+        ),
     )
-    return issues, blocking
+    with open_json_stream(path, "bandit") as stream:
+        if stream is None or stream.peek() != "{":
+            return 0, [], False, seen.match
+        for key in stream.items():
+            if key != "results" or stream.peek() != "[":
+                stream.value()
+                continue
+            for _ in stream.elements():
+                i = stream.value()
+                if not isinstance(i, dict):
+                    continue
+                new = seen.is_new(i)
+                severity = str(i.get("issue_severity", "LOW"))
+                issue = BanditIssue(
+                    filename=i.get("filename", ""),
+                    line_number=int(i.get("line_number", 0) or 0),
+                    severity=severity,
+                    confidence=str(i.get("issue_confidence", "LOW")),
+                    test_id=i.get("test_id", ""),
+                    test_name=i.get("test_name", ""),
+                    issue_text=(i.get("issue_text", "") or "").strip(),
+                )
+                emit("bandit", issue, new=new)
+                if not new:
+                    continue
+                if threshold > 0 and SEVERITY_ORDER.get(severity.lower(), 0) >= threshold:
+                    blocking = True
+                issues.push(issue)
+    return issues.seen, issues.items(), blocking, seen.match
 
 
 def parse_command_results(path: str) -> list[CommandResult]:
-    p = Path(path)
-    if not p.exists() or not p.read_text(encoding="utf-8").strip():
-        return []
+    with open_artifact(path, "commands") as reader:
+        text = reader.read().decode("utf-8") if reader else ""
 
     out: list[CommandResult] = []
-    for raw in p.read_text(encoding="utf-8").splitlines():
-        parts = raw.split("\t", 4)
+    for raw in text.splitlines():
+        parts = raw.split("\t")
         if len(parts) < 4:
             continue
         name, command, exit_code, status = parts[:4]
+        wall, cpu, rss = (parts[5:8] + ["", "", ""])[:3]
         out.append(
             CommandResult(
                 name=name,
                 command=command,
                 exit_code=int(exit_code),
                 status=status,
+                artifacts=parts[4] if len(parts) > 4 else "",
+                wall_seconds=float(wall) if wall else None,
+                cpu_seconds=float(cpu) if cpu else None,
+                max_rss_kb=int(rss) if rss else None,
             )
         )
     return out
 
 
-def render_report(template_path: str, output_path: str, context: dict[str, Any]) -> None:
-    tmpl = Path(template_path)
-    env = Environment(
-        loader=FileSystemLoader(str(tmpl.parent)),
-        autoescape=False,
-        trim_blocks=True,
-        lstrip_blocks=True,
-    )
-    template = env.get_template(tmpl.name)
-    Path(output_path).write_text(template.render(**context), encoding="utf-8")
+ParseTask = tuple[Callable[..., Any], tuple[Any, ...]]
+
+
+def parse_partial(func: Callable[..., T], fallback: T, *args: Any) -> T:
+    """Parse what a timed-out tool left behind.
+
+    Records that were complete before the cut are kept (see ``PARTIAL_ARTIFACTS``);
+    an artifact that cannot be read at all yields ``fallback``.
+    """
+    token = PARTIAL_ARTIFACTS.set(True)
+    try:
+        return func(*args)
+    except (ValueError, SyntaxError, EOFError) as exc:
+        # json.JSONDecodeError is a ValueError and ElementTree.ParseError a SyntaxError.
+        print(f"builder: {func.__name__}: unreadable partial artifact ({exc})", file=sys.stderr)
+        return fallback
+    finally:
+        PARTIAL_ARTIFACTS.reset(token)
+
+
+def _run_parse_task(
+    func: Callable[..., Any],
+    args: tuple[Any, ...],
+    findings_part: str | None = None,
+    sarif_path: str | None = None,
+) -> tuple[Any, list[ArtifactStat]]:
+    # Worker processes are reused across tasks, so only ship back the new stats.
+    start = len(ARTIFACT_STATS)
+    with record_sinks(findings_part, sarif_path):
+        result = func(*args)
+    return result, ARTIFACT_STATS[start:]
+
+
+def parse_artifacts(
+    tasks: dict[str, ParseTask],
+    jobs: int = 1,
+    findings_path: str | None = None,
+    sarif_path: str | None = None,
+) -> dict[str, Any]:
+    """Run independent parse tasks, in a process pool when ``jobs`` > 1.
+
+    Every task returns an already bounded result, so only compact samples and
+    counters cross the process boundary. With ``findings_path`` every record is
+    also streamed to NDJSON: directly when serial, otherwise through one part
+    file per task, concatenated in task order so the output does not depend on
+    ``jobs``. SARIF runs are per tool, so tasks write them to separate parts
+    either way and ``write_sarif`` assembles the document.
+    """
+    if jobs <= 1 or len(tasks) <= 1:
+        with record_sinks(findings_path, sarif_path):
+            results = {name: func(*args) for name, (func, args) in tasks.items()}
+        if sarif_path:
+            write_sarif(sarif_path)
+        return results
+
+    from concurrent.futures import ProcessPoolExecutor
+
+    parts = {name: f"{findings_path}.{name}.part" for name in tasks} if findings_path else {}
+    results: dict[str, Any] = {}
+    with ProcessPoolExecutor(max_workers=min(jobs, len(tasks))) as pool:
+        futures = {
+            name: pool.submit(_run_parse_task, func, args, parts.get(name), sarif_path)
+            for name, (func, args) in tasks.items()
+        }
+        for name, future in futures.items():
+            results[name], stats = future.result()
+            ARTIFACT_STATS.extend(stats)
+    if findings_path:
+        with open(findings_path, "wb") as out:
+            for part in parts.values():
+                with open(part, "rb") as fh:
+                    shutil.copyfileobj(fh, out)
+                os.remove(part)
+    if sarif_path:
+        write_sarif(sarif_path)
+    return results
+
+
+class BudgetWriter:
+    """Write rendered report text while keeping it under a byte budget.
+
+    Templates mark sections with ``{{ section("name") }}`` and ``{{ end_section() }}``
+    on lines of their own. Inside a section, lines are kept while the section's
+    budget lasts; the rest are counted and replaced by a single "N more omitted"
+    trailer at the section end. Everything is also held to ``max_bytes`` overall,
+    with room reserved for a final truncation notice, before which any
+    ``<details>`` block left open by the cut is closed. Text is handled line by
+    line as ``template.generate()`` yields it, so memory is bounded by the
+    longest line rather than by the report.
+    """
+
+    def __init__(self, out: TextIO, max_bytes: int | None, section_bytes: int | None) -> None:
+        self._out = out
+        self._remaining = max_bytes - BUDGET_NOTICE_RESERVE if max_bytes else None
+        self._section_bytes = section_bytes or None
+        self._pending = ""
+        self._section_left: int | None = None
+        self._omitted = 0
+        self._dropped = 0
+        self._open_details = 0
+
+    def write(self, chunk: str) -> None:
+        self._pending += chunk
+        if "\n" not in chunk:
+            return
+        *lines, self._pending = self._pending.split("\n")
+        for line in lines:
+            self._line(line + "\n")
+
+    def close(self) -> None:
+        if self._pending:
+            self._line(self._pending)
+            self._pending = ""
+        if self._dropped:
+            self._remaining = None
+            if self._open_details > 0:
+                self._emit("\n" + "</details>\n" * self._open_details)
+            self._emit(
+                f"\n_Report truncated: {self._dropped} more lines omitted to stay under the"
+                " comment size limit. See the full report artifact._\n"
+            )
+
+    def _line(self, line: str) -> None:
+        if line.startswith(SECTION_MARK):
+            name = line.strip().strip(SECTION_MARK)
+            if name:
+                self._section_left, self._omitted = self._section_bytes, 0
+                return
+            if self._omitted:
+                self._emit(
+                    f"\n_… {self._omitted} more lines omitted to keep this comment short."
+                    " See the full report artifact._\n\n"
+                )
+            self._section_left, self._omitted = None, 0
+            return
+        if self._section_left is not None:
+            size = len(line.encode("utf-8"))
+            if self._omitted or size > self._section_left:
+                self._omitted += 1
+                return
+            self._section_left -= size
+        self._emit(line)
+
+    def _emit(self, text: str) -> None:
+        if self._remaining is not None:
+            size = len(text.encode("utf-8"))
+            if self._dropped or size > self._remaining:
+                self._dropped += 1
+                return
+            self._remaining -= size
+        self._out.write(text)
+        self._open_details += text.count("<details") - text.count("</details>")
 
 
-def write_summary_json(path: str, payload: dict[str, Any]) -> None:
-    Path(path).write_text(json.dumps(payload, indent=2), encoding="utf-8")
+def _section_marks(name: str = "") -> str:
+    return f"{SECTION_MARK}{name}{SECTION_MARK}"
+
+
+def render_report(
+    template_path: str,
+    output_path: str,
+    context: dict[str, Any],
+    max_bytes: int | None = None,
+    section_bytes: int | None = None,
+    full_output: str | None = None,
+) -> None:
+    """Stream the report through ``BudgetWriter``; ``full_output`` gets it without budgets."""
+    template = load_template(template_path)
+    marks = {"section": _section_marks, "end_section": _section_marks}
+    targets = [(output_path, max_bytes, section_bytes)]
+    if full_output:
+        targets.append((full_output, None, None))
+    for path, limit, per_section in targets:
+        with open(path, "w", encoding="utf-8") as fh:
+            writer = BudgetWriter(fh, limit, per_section)
+            for chunk in template.generate(**context, **marks):
+                writer.write(chunk)
+            writer.close()
+
+
+class FindingIndex:
+    """The summary's canonical findings list; sections refer to entries by index.
+
+    Entries are encoded to compact JSON when added, one string per finding.
+    """
+
+    def __init__(self) -> None:
+        self.items: list[RawJSON] = []
+
+    def add(self, tool: str, items: Iterable[Any]) -> list[int]:
+        start = len(self.items)
+        self.items.extend(
+            RawJSON(
+                _encode_any({"tool": tool, **item})
+                if isinstance(item, dict)
+                else encode_record(item, tool=tool)
+            )
+            for item in items
+        )
+        return list(range(start, len(self.items)))
+
+
+def write_summary_json(path: str, payload: dict[str, Any], fmt: str = "pretty") -> None:
+    """Write the summary as indented JSON, or compact JSON optionally gzip/zstd compressed.
+
+    The document is encoded incrementally by ``iter_json`` straight into the
+    (compressed) file instead of being built as one string.
+    """
+    with ExitStack() as stack:
+        out: BinaryIO = stack.enter_context(open(path, "wb"))
+        if fmt == "gzip":
+            out = stack.enter_context(gzip.GzipFile(fileobj=out, mode="wb", mtime=0))
+        elif fmt == "zstd":
+            out = stack.enter_context(_zstandard().ZstdCompressor(level=10).stream_writer(out))
+        text = io.TextIOWrapper(out, encoding="utf-8", write_through=True)
+        for chunk in iter_json(payload, 2 if fmt == "pretty" else None):
+            text.write(chunk)
+        text.flush()
+        text.detach()
+
+
+def _zstandard() -> Any:
+    try:
+        import zstandard
+    except ImportError as exc:
+        raise SystemExit("builder: zstd summaries need the 'zstandard' package") from exc
+    return zstandard
 
 
 def write_outputs(
@@ -222,6 +1597,9 @@ def write_outputs(
     blocking: bool,
     report_file: str,
     summary_file: str,
+    findings_file: str = "",
+    sarif_file: str = "",
+    full_report_file: str = "",
 ) -> None:
     with Path(outputs_path).open("a", encoding="utf-8") as f:
         f.write(f"ruff_issues={summary.ruff_issues}\n")
@@ -233,25 +1611,66 @@ def write_outputs(
         f.write(f"blocking={'true' if blocking else 'false'}\n")
         f.write(f"report_file={report_file}\n")
         f.write(f"summary_file={summary_file}\n")
+        f.write(f"findings_file={findings_file}\n")
+        f.write(f"sarif_file={sarif_file}\n")
+        f.write(f"full_report_file={full_report_file}\n")
+
+
+def report_artifact_stats(stats: list[ArtifactStat]) -> None:
+    for stat in stats:
+        print(
+            f"artifact {stat.name}: {stat.bytes_read}/{stat.size} bytes "
+            f"via {stat.mode} in {stat.seconds:.3f}s ({stat.path})",
+            file=sys.stderr,
+        )
 
 
-def _short_preview(obj: Any) -> str:
-    text = json.dumps(obj, ensure_ascii=False)
-    if len(text) <= MAX_PREVIEW_CHARS:
-        return text
-    return text[:MAX_PREVIEW_CHARS] + "... [truncated]"
+def parse_tool_cache(values: Iterable[str]) -> dict[str, str]:
+    """Parse repeated ``--tool-cache name=warm|partial|cold`` flags."""
+    states: dict[str, str] = {}
+    for value in values:
+        name, sep, state = value.partition("=")
+        if not sep or not name or state not in TOOL_CACHE_STATES:
+            raise ValueError(f"expected NAME=warm, NAME=partial or NAME=cold, got {value!r}")
+        states[name] = state
+    return states
+
+
+def load_changed_files(path: str | None) -> list[str] | None:
+    """Read the changed-only file list; ``None`` means the whole tree was checked."""
+    if not path:
+        return None
+    file_path = Path(path)
+    if not file_path.exists():
+        return []
+    lines = file_path.read_text(encoding="utf-8").splitlines()
+    return [normalize_path(line.strip()) for line in lines if line.strip()]
 
 
 def main() -> None:
+    started = time.perf_counter()
     parser = argparse.ArgumentParser(description="Build aggregated Python quality report")
     parser.add_argument("--ruff", required=True)
     parser.add_argument("--pyright", required=True)
-    parser.add_argument("--junit", required=True)
-    parser.add_argument("--coverage", required=True)
+    parser.add_argument(
+        "--junit",
+        action="append",
+        required=True,
+        help="JUnit XML report; repeat or use a glob to merge sharded runs",
+    )
+    parser.add_argument(
+        "--coverage",
+        action="append",
+        required=True,
+        help=(
+            "coverage.json, Cobertura XML, lcov or .coverage data file; repeat or use a"
+            " glob to merge sharded runs"
+        ),
+    )
     parser.add_argument("--bandit", required=False, default="bandit.json")
     parser.add_argument("--commands", required=True)
-    parser.add_argument("--template", required=True)
-    parser.add_argument("--output", required=True)
+    parser.add_argument("--template", required=False)
+    parser.add_argument("--output", required=False)
     parser.add_argument("--summary", required=True)
     parser.add_argument("--outputs", required=True)
     parser.add_argument("--coverage-threshold", type=float, default=80.0)
@@ -261,27 +1680,144 @@ def main() -> None:
         choices=["none", "low", "medium", "high"],
         default="none",
     )
+    parser.add_argument(
+        "--baseline",
+        default=None,
+        help="Base-branch quality_summary.json; only findings missing from it are reported",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="Parse artifacts in N worker processes (0 = one per CPU, 1 = serial)",
+    )
+    parser.add_argument(
+        "--summary-format",
+        choices=SUMMARY_FORMATS,
+        default="pretty",
+        help="quality_summary.json encoding: indented, compact, or compact gzip/zstd",
+    )
+    parser.add_argument(
+        "--findings-ndjson",
+        default=None,
+        help="Also stream every finding, failed test and coverage file to this NDJSON file",
+    )
+    parser.add_argument(
+        "--sarif",
+        default=None,
+        help="Also stream ruff, pyright and bandit findings to this SARIF 2.1.0 file",
+    )
+    parser.add_argument(
+        "--max-report-bytes",
+        type=int,
+        default=REPORT_MAX_BYTES,
+        help="Byte budget of the markdown report (0 = unlimited)",
+    )
+    parser.add_argument(
+        "--section-bytes",
+        type=int,
+        default=SECTION_MAX_BYTES,
+        help="Byte budget of each findings table in the report (0 = unlimited)",
+    )
+    parser.add_argument(
+        "--full-output",
+        default=None,
+        help="Also write the report without byte budgets to this file",
+    )
+    parser.add_argument(
+        "--summary-only",
+        action="store_true",
+        help="Only write the JSON summary and $GITHUB_OUTPUT values; skip markdown rendering",
+    )
+    parser.add_argument(
+        "--changed-files",
+        default=None,
+        help="Files ruff/pyright/bandit were limited to, one per line; marks the report partial",
+    )
+    parser.add_argument(
+        "--changed-base",
+        default="",
+        help="Ref the changed files were computed against, shown in the report",
+    )
+    parser.add_argument(
+        "--tool-cache",
+        action="append",
+        default=[],
+        metavar="NAME=STATE",
+        help=(
+            "Whether a tool started with its exact cache (warm), one restored from an"
+            " earlier run (partial) or none (cold)"
+        ),
+    )
     args = parser.parse_args()
+    try:
+        tool_cache = parse_tool_cache(args.tool_cache)
+    except ValueError as exc:
+        parser.error(f"--tool-cache: {exc}")
+    if not args.summary_only and not (args.template and args.output):
+        parser.error("--template and --output are required unless --summary-only is set")
+    jobs = args.jobs if args.jobs > 0 else (os.cpu_count() or 1)
+    changed_files = load_changed_files(args.changed_files)
 
-    ruff_findings = parse_ruff(args.ruff)
-    pyright_errors, pyright_warnings, pyright_findings = parse_pyright(args.pyright)
-    tests_total, tests_failed, tests_skipped, failed_tests = parse_junit(args.junit)
-    tests_passed = max(tests_total - tests_failed - tests_skipped, 0)
+    # Command results decide which sections may come from truncated artifacts,
+    # so they are read before everything else.
+    command_results = parse_command_results(args.commands)
+    timed_out = {c.name: c for c in command_results if c.status == "timeout"}
+    incomplete = {section for name in timed_out for section in TOOL_SECTIONS.get(name, ())}
+    empty_results: dict[str, Any] = {
+        "ruff": (0, [], [], BaselineMatch([])),
+        "pyright": (0, 0, [], BaselineMatch([])),
+        "junit": (0, 0, 0, []),
+        "coverage": (0.0, []),
+        "bandit": (0, [], False, BaselineMatch([])),
+    }
 
-    coverage, coverage_files = parse_coverage(args.coverage)
-    below_threshold = sorted(
-        [f for f in coverage_files if f.percent < args.coverage_threshold],
-        key=lambda x: x.percent,
-    )[:MAX_ITEMS]
+    tasks: dict[str, ParseTask] = {
+        "ruff": (parse_ruff, (args.ruff, MAX_ITEMS, args.baseline)),
+        "pyright": (parse_pyright, (args.pyright, MAX_ITEMS, args.baseline)),
+        "junit": (parse_junit_files, (expand_inputs(args.junit),)),
+        "coverage": (
+            parse_coverage_files,
+            (expand_inputs(args.coverage), args.coverage_threshold),
+        ),
+        "bandit": (
+            parse_bandit,
+            (args.bandit, args.fail_on_security, MAX_ITEMS, args.baseline),
+        ),
+    }
+    for section in incomplete:
+        func, task_args = tasks[section]
+        tasks[section] = (parse_partial, (func, empty_results[section], *task_args))
+    parsed = parse_artifacts(
+        tasks, jobs=jobs, findings_path=args.findings_ndjson, sarif_path=args.sarif
+    )
 
-    bandit_issues, bandit_blocking = parse_bandit(args.bandit, args.fail_on_security)
-    command_results = parse_command_results(args.commands)
+    ruff_issues, ruff_findings, ruff_files, ruff_match = parsed["ruff"]
+    pyright_errors, pyright_warnings, pyright_findings, pyright_match = parsed["pyright"]
+    tests_total, tests_failed, tests_skipped, failed_tests = parsed["junit"]
+    tests_passed = max(tests_total - tests_failed - tests_skipped, 0)
+    coverage, below_threshold = parsed["coverage"]
+    bandit_count, bandit_issues, bandit_blocking, bandit_match = parsed["bandit"]
+    baseline_known = {
+        "ruff": ruff_match.known,
+        "pyright": pyright_match.known,
+        "bandit": bandit_match.known,
+    }
     command_failures = [
-        c for c in command_results if c.name in {"ruff", "pyright", "pytest"} and c.status == "fail"
+        c
+        for c in command_results
+        if c.status == "timeout"
+        or (
+            c.name in {"ruff", "pyright", "pytest"}
+            and c.status == "fail"
+            # With a baseline, exit code 1 from a linter only means "findings exist";
+            # those are gated through the new-findings counters instead.
+            and not (args.baseline and c.name in FINGERPRINT_FIELDS and c.exit_code == 1)
+        )
     ]
 
     summary = Summary(
-        ruff_issues=len(ruff_findings),
+        ruff_issues=ruff_issues,
         pyright_errors=pyright_errors,
         pyright_warnings=pyright_warnings,
         tests_total=tests_total,
@@ -289,7 +1825,7 @@ def main() -> None:
         tests_failed=tests_failed,
         tests_skipped=tests_skipped,
         coverage=coverage,
-        bandit_issues=len(bandit_issues),
+        bandit_issues=bandit_count,
         bandit_blocking=bandit_blocking,
     )
 
@@ -305,28 +1841,40 @@ def main() -> None:
     )
     blocking = quality_blocking or summary.bandit_blocking
 
-    render_report(
-        args.template,
-        args.output,
-        {
-            "summary": summary,
-            "coverage_threshold": args.coverage_threshold,
-            "quality_blocking": quality_blocking,
-            "security_blocking": summary.bandit_blocking,
-            "blocking": blocking,
-            "ruff_findings": ruff_findings[:MAX_ITEMS],
-            "pyright_findings": pyright_findings,
-            "failed_tests": failed_tests,
-            "below_threshold": below_threshold,
-            "bandit_issues": bandit_issues,
-            "command_results": command_results,
-        },
-    )
+    if not args.summary_only:
+        render_report(
+            args.template,
+            args.output,
+            {
+                "summary": summary,
+                "coverage_threshold": args.coverage_threshold,
+                "quality_blocking": quality_blocking,
+                "security_blocking": summary.bandit_blocking,
+                "blocking": blocking,
+                "ruff_findings": ruff_findings,
+                "ruff_files": ruff_files,
+                "pyright_findings": pyright_findings,
+                "failed_tests": failed_tests,
+                "below_threshold": below_threshold,
+                "bandit_issues": bandit_issues,
+                "command_results": command_results,
+                "baseline": args.baseline,
+                "baseline_known": sum(baseline_known.values()),
+                "changed_files": changed_files,
+                "changed_base": args.changed_base,
+                "tool_cache": tool_cache,
+                "timed_out": timed_out,
+            },
+            max_bytes=args.max_report_bytes or None,
+            section_bytes=args.section_bytes or None,
+            full_output=args.full_output,
+        )
 
+    findings = FindingIndex()
     write_summary_json(
         args.summary,
         {
-            "summary": asdict(summary),
+            "summary": summary,
             "gates": {
                 "quality_blocking": quality_blocking,
                 "security_blocking": summary.bandit_blocking,
@@ -334,44 +1882,80 @@ def main() -> None:
             },
             "checks": {
                 "ruff": {
-                    "issues": len(ruff_findings),
-                    "sample": ruff_findings[:MAX_ITEMS],
+                    "issues": ruff_issues,
+                    "sample": findings.add("ruff", ruff_findings),
+                    "top_files": [{"file": f, "issues": n} for f, n in ruff_files],
                 },
                 "pyright": {
                     "errors": pyright_errors,
                     "warnings": pyright_warnings,
-                    "diagnostics": pyright_findings,
+                    "diagnostics": findings.add("pyright", pyright_findings),
                 },
                 "tests": {
                     "total": tests_total,
                     "passed": tests_passed,
                     "failed": tests_failed,
                     "skipped": tests_skipped,
-                    "failures": [asdict(f) for f in failed_tests],
+                    "failures": findings.add("pytest", failed_tests),
                 },
                 "coverage": {
                     "global": coverage,
                     "threshold": args.coverage_threshold,
-                    "below_threshold": [asdict(f) for f in below_threshold],
+                    "below_threshold": below_threshold,
                 },
                 "bandit": {
-                    "issues": len(bandit_issues),
+                    "issues": bandit_count,
                     "blocking": bandit_blocking,
-                    "findings": [asdict(i) for i in bandit_issues],
+                    "findings": findings.add("bandit", bandit_issues),
                 },
             },
-            "commands": [asdict(c) for c in command_results],
-            "command_failures": [asdict(c) for c in command_failures],
-            "raw_preview": {
-                "ruff": _short_preview(ruff_findings[:10]),
-                "pyright": _short_preview(pyright_findings[:10]),
-                "failed_tests": _short_preview([asdict(f) for f in failed_tests[:10]]),
-                "bandit": _short_preview([asdict(i) for i in bandit_issues[:10]]),
+            "commands": command_results,
+            "timings": {
+                c.name: {
+                    "wall_seconds": c.wall_seconds,
+                    "cpu_seconds": c.cpu_seconds,
+                    "max_rss_kb": c.max_rss_kb,
+                    "cache": tool_cache.get(c.name),
+                }
+                for c in command_results
+                if c.wall_seconds is not None
             },
+            "tool_cache": tool_cache,
+            "incomplete": sorted(incomplete),
+            "artifacts": ARTIFACT_STATS,
+            "baseline": (
+                {"path": args.baseline, "known": baseline_known} if args.baseline else None
+            ),
+            "scope": {
+                "partial": changed_files is not None,
+                "base": args.changed_base or None,
+                "changed_files": changed_files,
+            },
+            "fingerprints": {
+                "ruff": ruff_match.fingerprints,
+                "pyright": pyright_match.fingerprints,
+                "bandit": bandit_match.fingerprints,
+            },
+            "command_failures": command_failures,
+            # Last, so consumers can stream every finding after reading the rest.
+            "findings": findings.items,
         },
+        args.summary_format,
     )
 
-    write_outputs(args.outputs, summary, blocking, args.output, args.summary)
+    report_file = "" if args.summary_only else args.output
+    write_outputs(
+        args.outputs,
+        summary,
+        blocking,
+        report_file,
+        args.summary,
+        args.findings_ndjson or "",
+        args.sarif or "",
+        "" if args.summary_only else args.full_output or "",
+    )
+    report_artifact_stats(ARTIFACT_STATS)
+    print(f"builder: done in {time.perf_counter() - started:.3f}s", file=sys.stderr)
 
     if blocking:
         sys.exit(1)
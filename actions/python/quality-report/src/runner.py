@@ -0,0 +1,196 @@
+"""Run the quality tools concurrently and record their outcome.
+
+Each check is a shell command started with ``bash -lc``. Its stdout/stderr go
+straight to ``<logs-dir>/<name>.log``. The checks run concurrently: the asyncio
+event loop waits on each child with ``os.wait4`` in a worker thread, which also
+returns the resource usage of that child's process tree. Once every check has
+finished, one line per check is appended to the status file in the format read
+by ``builder.parse_command_results``:
+
+    name<TAB>command<TAB>exit_code<TAB>status<TAB>artifacts<TAB>wall_s<TAB>cpu_s<TAB>max_rss_kb
+
+A check given a time budget runs in its own process group. When the budget
+is exceeded the whole group gets SIGTERM, then SIGKILL after a short grace
+period, and the check is recorded with status ``timeout`` and exit code 124
+(the convention of coreutils ``timeout``) next to the time it ran.
+
+The logs are then echoed in collapsible groups.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import os
+import signal
+import subprocess
+import sys
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+TIMEOUT_EXIT_CODE = 124
+KILL_GRACE_SECONDS = 10.0
+
+
+@dataclass
+class Check:
+    name: str
+    command: str
+    artifacts: str
+    timeout: float | None = None
+
+
+@dataclass
+class CheckResult:
+    check: Check
+    exit_code: int
+    log_path: Path
+    wall_seconds: float
+    cpu_seconds: float
+    max_rss_kb: int
+    timed_out: bool = False
+
+    @property
+    def status(self) -> str:
+        if self.timed_out:
+            return "timeout"
+        return "pass" if self.exit_code == 0 else "fail"
+
+
+def _tsv_field(value: str) -> str:
+    return " ".join(value.split("\t")).replace("\n", " ")
+
+
+def _max_rss_kb(usage: os.struct_rusage) -> int:
+    # ru_maxrss is reported in kilobytes on Linux and in bytes on macOS.
+    return usage.ru_maxrss // 1024 if sys.platform == "darwin" else usage.ru_maxrss
+
+
+def _kill_group(pgid: int, sig: signal.Signals) -> None:
+    try:
+        os.killpg(pgid, sig)
+    except ProcessLookupError:
+        pass
+
+
+async def run_check(check: Check, logs_dir: Path, limit: asyncio.Semaphore) -> CheckResult:
+    log_path = logs_dir / f"{check.name}.log"
+    timed_out = False
+    async with limit:
+        with log_path.open("wb") as log:
+            started = time.monotonic()
+            proc = subprocess.Popen(
+                ["bash", "-lc", check.command],
+                stdin=subprocess.DEVNULL,
+                stdout=log,
+                stderr=subprocess.STDOUT,
+                start_new_session=check.timeout is not None,
+            )
+            waiter = asyncio.ensure_future(asyncio.to_thread(os.wait4, proc.pid, 0))
+            try:
+                await asyncio.wait_for(asyncio.shield(waiter), check.timeout)
+            except TimeoutError:
+                timed_out = True
+                _kill_group(proc.pid, signal.SIGTERM)
+                try:
+                    await asyncio.wait_for(asyncio.shield(waiter), KILL_GRACE_SECONDS)
+                except TimeoutError:
+                    _kill_group(proc.pid, signal.SIGKILL)
+            _, wait_status, usage = await waiter
+            wall = time.monotonic() - started
+            if timed_out:
+                # Reap anything in the group that outlived the shell.
+                _kill_group(proc.pid, signal.SIGKILL)
+    proc.returncode = os.waitstatus_to_exitcode(wait_status)
+    if timed_out:
+        with log_path.open("a", encoding="utf-8") as log:
+            log.write(f"\n[runner] {check.name} exceeded its {check.timeout:g}s budget\n")
+    return CheckResult(
+        check=check,
+        exit_code=TIMEOUT_EXIT_CODE if timed_out else proc.returncode,
+        log_path=log_path,
+        wall_seconds=round(wall, 3),
+        cpu_seconds=round(usage.ru_utime + usage.ru_stime, 3),
+        max_rss_kb=_max_rss_kb(usage),
+        timed_out=timed_out,
+    )
+
+
+async def run_checks(checks: list[Check], logs_dir: Path, max_parallel: int) -> list[CheckResult]:
+    logs_dir.mkdir(parents=True, exist_ok=True)
+    limit = asyncio.Semaphore(max_parallel if max_parallel > 0 else max(len(checks), 1))
+    return list(await asyncio.gather(*(run_check(c, logs_dir, limit) for c in checks)))
+
+
+def write_status(path: Path, results: list[CheckResult]) -> None:
+    with path.open("a", encoding="utf-8") as f:
+        for r in results:
+            f.write(
+                "\t".join(
+                    (
+                        r.check.name,
+                        _tsv_field(r.check.command),
+                        str(r.exit_code),
+                        r.status,
+                        r.check.artifacts,
+                        f"{r.wall_seconds:.3f}",
+                        f"{r.cpu_seconds:.3f}",
+                        str(r.max_rss_kb),
+                    )
+                )
+                + "\n"
+            )
+
+
+def echo_logs(results: list[CheckResult]) -> None:
+    for r in results:
+        print(f"::group::{r.check.name} ({r.status}, exit code {r.exit_code})")
+        sys.stdout.flush()
+        with r.log_path.open("rb") as log:
+            while chunk := log.read(1 << 16):
+                sys.stdout.buffer.write(chunk)
+        sys.stdout.buffer.flush()
+        print("\n::endgroup::")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Run quality checks concurrently")
+    parser.add_argument(
+        "--check",
+        nargs=3,
+        action="append",
+        default=[],
+        metavar=("NAME", "COMMAND", "ARTIFACTS"),
+        help="Check to run; repeat for every tool",
+    )
+    parser.add_argument(
+        "--timeout",
+        nargs=2,
+        action="append",
+        default=[],
+        metavar=("NAME", "SECONDS"),
+        help="Time budget for a check; 0 means no limit",
+    )
+    parser.add_argument("--status", required=True, help="command_status.tsv to append to")
+    parser.add_argument("--logs-dir", default="quality-logs")
+    parser.add_argument(
+        "--max-parallel",
+        type=int,
+        default=0,
+        help="Maximum checks running at once (0 = all of them)",
+    )
+    args = parser.parse_args()
+
+    budgets = {name: float(seconds) for name, seconds in args.timeout}
+    checks = [
+        Check(name=n, command=c, artifacts=a, timeout=budgets.get(n) or None)
+        for n, c, a in args.check
+    ]
+    results = asyncio.run(run_checks(checks, Path(args.logs_dir), args.max_parallel))
+    write_status(Path(args.status), results)
+    echo_logs(results)
+
+
+if __name__ == "__main__":
+    main()
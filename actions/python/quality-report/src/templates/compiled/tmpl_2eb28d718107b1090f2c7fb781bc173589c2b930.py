@@ -0,0 +1,312 @@
+from jinja2.runtime import LoopContext, Macro, Markup, Namespace, TemplateNotFound, TemplateReference, TemplateRuntimeError, Undefined, escape, identity, internalcode, markup_join, missing, str_join
+name = 'report.md.j2'
+
+def root(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    l_0_blocking = resolve('blocking')
+    l_0_quality_blocking = resolve('quality_blocking')
+    l_0_security_blocking = resolve('security_blocking')
+    l_0_baseline = resolve('baseline')
+    l_0_baseline_known = resolve('baseline_known')
+    l_0_changed_files = resolve('changed_files')
+    l_0_changed_base = resolve('changed_base')
+    l_0_summary = resolve('summary')
+    l_0_command_results = resolve('command_results')
+    l_0_failed_tests = resolve('failed_tests')
+    l_0_section = resolve('section')
+    l_0_end_section = resolve('end_section')
+    l_0_below_threshold = resolve('below_threshold')
+    l_0_coverage_threshold = resolve('coverage_threshold')
+    l_0_ruff_findings = resolve('ruff_findings')
+    l_0_ruff_files = resolve('ruff_files')
+    l_0_pyright_findings = resolve('pyright_findings')
+    l_0_bandit_issues = resolve('bandit_issues')
+    l_0_incomplete_note = l_0_timed = missing
+    try:
+        t_1 = environment.filters['format']
+    except KeyError:
+        @internalcode
+        def t_1(*unused):
+            raise TemplateRuntimeError("No filter named 'format' found.")
+    try:
+        t_2 = environment.filters['length']
+    except KeyError:
+        @internalcode
+        def t_2(*unused):
+            raise TemplateRuntimeError("No filter named 'length' found.")
+    try:
+        t_3 = environment.filters['list']
+    except KeyError:
+        @internalcode
+        def t_3(*unused):
+            raise TemplateRuntimeError("No filter named 'list' found.")
+    try:
+        t_4 = environment.filters['selectattr']
+    except KeyError:
+        @internalcode
+        def t_4(*unused):
+            raise TemplateRuntimeError("No filter named 'selectattr' found.")
+    try:
+        t_5 = environment.tests['none']
+    except KeyError:
+        @internalcode
+        def t_5(*unused):
+            raise TemplateRuntimeError("No test named 'none' found.")
+    pass
+    def macro(l_1_tool):
+        t_6 = []
+        l_1_timed_out = resolve('timed_out')
+        if l_1_tool is missing:
+            l_1_tool = undefined("parameter 'tool' was not provided", name='tool')
+        pass
+        if (l_1_tool in (undefined(name='timed_out') if l_1_timed_out is missing else l_1_timed_out)):
+            pass
+            t_6.extend((
+                '> ⏱ **Incomplete:** `',
+                str(l_1_tool),
+                '` was stopped after ',
+                str(t_1('%.0f', (environment.getattr(environment.getitem((undefined(name='timed_out') if l_1_timed_out is missing else l_1_timed_out), l_1_tool), 'wall_seconds') or 0))),
+                's (time budget exceeded); this section only shows what it wrote before then.\n\n',
+            ))
+        return concat(t_6)
+    context.exported_vars.add('incomplete_note')
+    context.vars['incomplete_note'] = l_0_incomplete_note = Macro(environment, macro, 'incomplete_note', ('tool',), False, False, False, context.eval_ctx.autoescape)
+    yield '# Python Quality Report\n\n'
+    if (undefined(name='blocking') if l_0_blocking is missing else l_0_blocking):
+        pass
+        yield '## ❌ Blocking issues found'
+    else:
+        pass
+        yield '## ✅ Quality gates passed'
+    yield '\n| Gate | Status |\n|---|---|\n| Quality gate | '
+    yield str(('❌ fail' if (undefined(name='quality_blocking') if l_0_quality_blocking is missing else l_0_quality_blocking) else '✅ pass'))
+    yield ' |\n| Security gate | '
+    yield str(('❌ fail' if (undefined(name='security_blocking') if l_0_security_blocking is missing else l_0_security_blocking) else '✅ pass'))
+    yield ' |\n\n'
+    if (undefined(name='baseline') if l_0_baseline is missing else l_0_baseline):
+        pass
+        yield '> Compared against baseline `'
+        yield str((undefined(name='baseline') if l_0_baseline is missing else l_0_baseline))
+        yield '`: only new Ruff, Pyright and Bandit findings are listed and gated ('
+        yield str((undefined(name='baseline_known') if l_0_baseline_known is missing else l_0_baseline_known))
+        yield ' pre-existing hidden).\n\n'
+    if (not t_5((undefined(name='changed_files') if l_0_changed_files is missing else l_0_changed_files))):
+        pass
+        yield '> ⚠️ Partial report: Ruff, Pyright and Bandit only checked the '
+        yield str(t_2((undefined(name='changed_files') if l_0_changed_files is missing else l_0_changed_files)))
+        yield ' Python file(s) changed'
+        if (undefined(name='changed_base') if l_0_changed_base is missing else l_0_changed_base):
+            pass
+            yield ' against `'
+            yield str((undefined(name='changed_base') if l_0_changed_base is missing else l_0_changed_base))
+            yield '`'
+        yield '. Tests and coverage ran on the whole suite.\n\n'
+    yield '## Executive Summary\n\n| Area | Value |\n|---|---:|\n| 🧪 Total tests | **'
+    yield str(environment.getattr((undefined(name='summary') if l_0_summary is missing else l_0_summary), 'tests_total'))
+    yield '** |\n| ✅ Passed tests | **'
+    yield str(environment.getattr((undefined(name='summary') if l_0_summary is missing else l_0_summary), 'tests_passed'))
+    yield '** |\n| ❌ Failed tests | **'
+    yield str(environment.getattr((undefined(name='summary') if l_0_summary is missing else l_0_summary), 'tests_failed'))
+    yield '** |\n| ⏭ Skipped tests | **'
+    yield str(environment.getattr((undefined(name='summary') if l_0_summary is missing else l_0_summary), 'tests_skipped'))
+    yield '** |\n| 📈 Coverage | **'
+    yield str(environment.getattr((undefined(name='summary') if l_0_summary is missing else l_0_summary), 'coverage'))
+    yield '%** |\n| 🧹 Ruff issues | **'
+    yield str(environment.getattr((undefined(name='summary') if l_0_summary is missing else l_0_summary), 'ruff_issues'))
+    yield '** |\n| 🧠 Pyright errors | **'
+    yield str(environment.getattr((undefined(name='summary') if l_0_summary is missing else l_0_summary), 'pyright_errors'))
+    yield '** |\n| 🧠 Pyright warnings | **'
+    yield str(environment.getattr((undefined(name='summary') if l_0_summary is missing else l_0_summary), 'pyright_warnings'))
+    yield '** |\n| 🔒 Bandit issues | **'
+    yield str(environment.getattr((undefined(name='summary') if l_0_summary is missing else l_0_summary), 'bandit_issues'))
+    yield '** |\n\n## Tool Status\n\n| Tool | Result | Exit code |\n|---|---|---:|\n'
+    for l_1_c in (undefined(name='command_results') if l_0_command_results is missing else l_0_command_results):
+        _loop_vars = {}
+        pass
+        yield '| `'
+        yield str(environment.getattr(l_1_c, 'name'))
+        yield '` | '
+        yield str(('✅ pass' if (environment.getattr(l_1_c, 'status') == 'pass') else ('⏭ skipped' if (environment.getattr(l_1_c, 'status') == 'skipped') else ('⏱ timeout' if (environment.getattr(l_1_c, 'status') == 'timeout') else '❌ fail'))))
+        yield ' | `'
+        yield str(environment.getattr(l_1_c, 'exit_code'))
+        yield '` |\n'
+    l_1_c = missing
+    l_0_timed = t_3(context.eval_ctx, t_4(context, (undefined(name='command_results') if l_0_command_results is missing else l_0_command_results), 'wall_seconds', 'ne', None))
+    context.vars['timed'] = l_0_timed
+    context.exported_vars.add('timed')
+    if (t_2((undefined(name='timed') if l_0_timed is missing else l_0_timed)) > 0):
+        pass
+        yield '\n<details>\n<summary>⏱ Tool timings</summary>\n\n| Tool | Wall time | CPU time | Peak RSS | Cache |\n|---|---:|---:|---:|---|\n'
+        for l_1_c in (undefined(name='timed') if l_0_timed is missing else l_0_timed):
+            l_1_tool_cache = resolve('tool_cache')
+            _loop_vars = {}
+            pass
+            yield '| `'
+            yield str(environment.getattr(l_1_c, 'name'))
+            yield '` | '
+            yield str(t_1('%.1f', environment.getattr(l_1_c, 'wall_seconds')))
+            yield 's | '
+            yield str(t_1('%.1f', (environment.getattr(l_1_c, 'cpu_seconds') or 0)))
+            yield 's | '
+            yield str(t_1('%.1f', ((environment.getattr(l_1_c, 'max_rss_kb') or 0) / 1024)))
+            yield ' MiB | '
+            yield str(context.call(environment.getattr((undefined(name='tool_cache') if l_1_tool_cache is missing else l_1_tool_cache), 'get'), environment.getattr(l_1_c, 'name'), '—', _loop_vars=_loop_vars))
+            yield ' |\n'
+        l_1_c = l_1_tool_cache = missing
+        yield '</details>\n'
+    yield '\n---\n\n<h3>\n  <img src="https://raw.githubusercontent.com/pytest-dev/pytest/main/doc/en/img/pytest_logo_curves.svg" alt="pytest" height="26"/>\n  Tests & Coverage\n</h3>\n\n'
+    yield str(context.call((undefined(name='incomplete_note') if l_0_incomplete_note is missing else l_0_incomplete_note), 'pytest'))
+    if (t_2((undefined(name='failed_tests') if l_0_failed_tests is missing else l_0_failed_tests)) == 0):
+        pass
+        yield '✅ No failed tests.\n'
+    else:
+        pass
+        yield '<details>\n<summary>❌ Failed tests ('
+        yield str(t_2((undefined(name='failed_tests') if l_0_failed_tests is missing else l_0_failed_tests)))
+        yield ')</summary>\n\n'
+        yield str(context.call((undefined(name='section') if l_0_section is missing else l_0_section), 'tests'))
+        yield '\n| Test | Message |\n|---|---|\n'
+        for l_1_f in (undefined(name='failed_tests') if l_0_failed_tests is missing else l_0_failed_tests):
+            _loop_vars = {}
+            pass
+            yield '| `'
+            yield str(environment.getattr(l_1_f, 'nodeid'))
+            yield '` | '
+            yield str(environment.getattr(l_1_f, 'message'))
+            yield ' |\n'
+        l_1_f = missing
+        yield str(context.call((undefined(name='end_section') if l_0_end_section is missing else l_0_end_section)))
+        yield '\n</details>\n'
+    yield '\n'
+    if (t_2((undefined(name='below_threshold') if l_0_below_threshold is missing else l_0_below_threshold)) == 0):
+        pass
+        yield '✅ All files meet coverage threshold ('
+        yield str((undefined(name='coverage_threshold') if l_0_coverage_threshold is missing else l_0_coverage_threshold))
+        yield '%).\n'
+    else:
+        pass
+        yield '<details>\n<summary>⚠️ Files below coverage threshold ('
+        yield str((undefined(name='coverage_threshold') if l_0_coverage_threshold is missing else l_0_coverage_threshold))
+        yield '%)</summary>\n\n'
+        yield str(context.call((undefined(name='section') if l_0_section is missing else l_0_section), 'coverage'))
+        yield '\n| File | Coverage | Missing lines |\n|---|---:|---|\n'
+        for l_1_f in (undefined(name='below_threshold') if l_0_below_threshold is missing else l_0_below_threshold):
+            _loop_vars = {}
+            pass
+            yield '| `'
+            yield str(environment.getattr(l_1_f, 'path'))
+            yield '` | '
+            yield str(environment.getattr(l_1_f, 'percent'))
+            yield '% | '
+            yield str(environment.getattr(l_1_f, 'missing_spans'))
+            yield ' |\n'
+        l_1_f = missing
+        yield str(context.call((undefined(name='end_section') if l_0_end_section is missing else l_0_end_section)))
+        yield '\n</details>\n'
+    yield '\n<h3>🧹 Ruff</h3>\n\n'
+    yield str(context.call((undefined(name='incomplete_note') if l_0_incomplete_note is missing else l_0_incomplete_note), 'ruff'))
+    if (t_2((undefined(name='ruff_findings') if l_0_ruff_findings is missing else l_0_ruff_findings)) == 0):
+        pass
+        yield '✅ No Ruff issues found.\n'
+    else:
+        pass
+        yield 'Findings: **'
+        yield str(environment.getattr((undefined(name='summary') if l_0_summary is missing else l_0_summary), 'ruff_issues'))
+        yield '**\n\n<details>\n<summary>🔎 Top Ruff findings</summary>\n\n'
+        yield str(context.call((undefined(name='section') if l_0_section is missing else l_0_section), 'ruff'))
+        yield '\n| File | Line | Rule | Message |\n|---|---:|---|---|\n'
+        for l_1_i in (undefined(name='ruff_findings') if l_0_ruff_findings is missing else l_0_ruff_findings):
+            _loop_vars = {}
+            pass
+            yield '| `'
+            yield str(environment.getattr(l_1_i, 'filename'))
+            yield '` | '
+            yield str(environment.getattr(environment.getattr(l_1_i, 'location'), 'row'))
+            yield ' | `'
+            yield str(environment.getattr(l_1_i, 'code'))
+            yield '` | '
+            yield str(environment.getattr(l_1_i, 'message'))
+            yield ' |\n'
+        l_1_i = missing
+        yield str(context.call((undefined(name='end_section') if l_0_end_section is missing else l_0_end_section)))
+        yield '\n</details>\n\n<details>\n<summary>📂 Files with most Ruff findings</summary>\n\n'
+        yield str(context.call((undefined(name='section') if l_0_section is missing else l_0_section), 'ruff-files'))
+        yield '\n| File | Findings |\n|---|---:|\n'
+        for (l_1_file, l_1_count) in (undefined(name='ruff_files') if l_0_ruff_files is missing else l_0_ruff_files):
+            _loop_vars = {}
+            pass
+            yield '| `'
+            yield str(l_1_file)
+            yield '` | '
+            yield str(l_1_count)
+            yield ' |\n'
+        l_1_file = l_1_count = missing
+        yield str(context.call((undefined(name='end_section') if l_0_end_section is missing else l_0_end_section)))
+        yield '\n</details>\n'
+    yield '\n<h3>🧠 Pyright</h3>\n\n'
+    yield str(context.call((undefined(name='incomplete_note') if l_0_incomplete_note is missing else l_0_incomplete_note), 'pyright'))
+    if (t_2((undefined(name='pyright_findings') if l_0_pyright_findings is missing else l_0_pyright_findings)) == 0):
+        pass
+        yield '✅ No Pyright diagnostics.\n'
+    else:
+        pass
+        yield '<details>\n<summary>🔎 Pyright diagnostics ('
+        yield str(t_2((undefined(name='pyright_findings') if l_0_pyright_findings is missing else l_0_pyright_findings)))
+        yield ')</summary>\n\n'
+        yield str(context.call((undefined(name='section') if l_0_section is missing else l_0_section), 'pyright'))
+        yield '\n| File | Line | Severity | Rule | Message |\n|---|---:|---|---|---|\n'
+        for l_1_d in (undefined(name='pyright_findings') if l_0_pyright_findings is missing else l_0_pyright_findings):
+            _loop_vars = {}
+            pass
+            yield '| `'
+            yield str(environment.getattr(l_1_d, 'file'))
+            yield '` | '
+            yield str(environment.getattr(l_1_d, 'line'))
+            yield ' | '
+            yield str(environment.getattr(l_1_d, 'severity'))
+            yield ' | '
+            yield str(environment.getattr(l_1_d, 'rule'))
+            yield ' | '
+            yield str(environment.getattr(l_1_d, 'message'))
+            yield ' |\n'
+        l_1_d = missing
+        yield str(context.call((undefined(name='end_section') if l_0_end_section is missing else l_0_end_section)))
+        yield '\n</details>\n'
+    yield '\n<h3>\n  <img src="https://raw.githubusercontent.com/PyCQA/bandit/main/logo/logomark.png" alt="bandit" height="22"/>\n  Security (Bandit)\n</h3>\n\n'
+    yield str(context.call((undefined(name='incomplete_note') if l_0_incomplete_note is missing else l_0_incomplete_note), 'bandit'))
+    if (t_2((undefined(name='bandit_issues') if l_0_bandit_issues is missing else l_0_bandit_issues)) == 0):
+        pass
+        yield '✅ No Bandit issues found.\n'
+    else:
+        pass
+        yield '<details>\n<summary>🛡️ Bandit findings ('
+        yield str(environment.getattr((undefined(name='summary') if l_0_summary is missing else l_0_summary), 'bandit_issues'))
+        yield ')</summary>\n\n'
+        yield str(context.call((undefined(name='section') if l_0_section is missing else l_0_section), 'bandit'))
+        yield '\n| File | Line | Severity | Confidence | Test | Message |\n|---|---:|---|---|---|---|\n'
+        for l_1_i in (undefined(name='bandit_issues') if l_0_bandit_issues is missing else l_0_bandit_issues):
+            _loop_vars = {}
+            pass
+            yield '| `'
+            yield str(environment.getattr(l_1_i, 'filename'))
+            yield '` | '
+            yield str(environment.getattr(l_1_i, 'line_number'))
+            yield ' | '
+            yield str(environment.getattr(l_1_i, 'severity'))
+            yield ' | '
+            yield str(environment.getattr(l_1_i, 'confidence'))
+            yield ' | '
+            yield str(environment.getattr(l_1_i, 'test_id'))
+            yield ' | '
+            yield str(environment.getattr(l_1_i, 'issue_text'))
+            yield ' |\n'
+        l_1_i = missing
+        yield str(context.call((undefined(name='end_section') if l_0_end_section is missing else l_0_end_section)))
+        yield '\n</details>\n'
+
+blocks = {}
+debug_info = '1=60&2=66&3=70&9=79&13=86&14=88&16=90&17=93&20=97&21=100&28=109&29=111&30=113&31=115&32=117&33=119&34=121&35=123&36=125&42=127&43=131&45=138&46=141&53=144&54=149&66=162&70=169&72=171&75=173&76=177&78=182&82=185&83=188&86=193&88=195&91=197&92=201&94=208&100=211&103=218&108=220&111=222&112=226&114=235&120=237&123=239&124=243&126=248&132=251&136=258&138=260&141=262&142=266&144=277&153=280&157=287&159=289&162=291&163=295&165=308'
\ No newline at end of file
@@ -0,0 +1,202 @@
+from __future__ import annotations
+
+import argparse
+import glob
+import heapq
+import json
+import statistics
+import sys
+import xml.etree.ElementTree as ET
+from collections.abc import Iterable
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+
+# Used for every unseen test when no report provides a single duration.
+DEFAULT_SECONDS = 1.0
+
+
+@dataclass
+class Shard:
+    index: int
+    seconds: float = 0.0
+    tests: list[str] = field(default_factory=list)
+
+
+def expand_inputs(patterns: Iterable[str]) -> list[str]:
+    """Expand junit paths and globs; globs match in sorted order, missing files are skipped."""
+    paths: list[str] = []
+    for pattern in patterns:
+        if glob.has_magic(pattern):
+            paths.extend(sorted(glob.glob(pattern, recursive=True)))
+        elif Path(pattern).is_file():
+            paths.append(pattern)
+    return list(dict.fromkeys(paths))
+
+
+def discover_test_files(test_dir: str) -> list[str]:
+    """Return pytest-style test modules under ``test_dir`` as posix paths."""
+    root = Path(test_dir)
+    files = {*root.rglob("test_*.py"), *root.rglob("*_test.py")}
+    return sorted(p.as_posix() for p in files)
+
+
+def _module_file(classname: str, modules: dict[str, str]) -> tuple[str, list[str]]:
+    """Split an xunit2 ``classname`` into its test file and the class path inside it."""
+    parts = classname.split(".") if classname else []
+    for cut in range(len(parts), 0, -1):
+        dotted = ".".join(parts[:cut])
+        if dotted in modules:
+            return modules[dotted], parts[cut:]
+    # Without a known module, test classes are the trailing capitalised parts.
+    cut = len(parts)
+    while cut > 1 and parts[cut - 1][:1].isupper():
+        cut -= 1
+    return "/".join(parts[:cut]) + ".py", parts[cut:]
+
+
+def node_id(attrib: dict[str, str], granularity: str, modules: dict[str, str]) -> str:
+    """Build the pytest node id (or test file) that a junit ``<testcase>`` ran."""
+    classname = attrib.get("classname") or ""
+    file_ = (attrib.get("file") or "").replace("\\", "/")
+    if file_:
+        dotted = Path(file_).with_suffix("").as_posix().replace("/", ".")
+        file_, classes = _module_file(classname, {dotted: file_})
+    else:
+        file_, classes = _module_file(classname, modules)
+    if granularity == "file":
+        return file_
+    return "::".join([file_, *classes, attrib.get("name") or ""])
+
+
+def load_durations(
+    paths: list[str], granularity: str = "file", modules: dict[str, str] | None = None
+) -> dict[str, float]:
+    """Return the seconds each test (or test file) took in previous junit reports.
+
+    Durations are summed within a report and averaged across the reports a test
+    appears in, so shards of one run and several past runs can be mixed.
+    """
+    modules = modules or {}
+    totals: dict[str, float] = {}
+    seen: dict[str, int] = {}
+    for path in paths:
+        report: dict[str, float] = {}
+        for _, elem in ET.iterparse(path, events=("end",)):
+            if elem.tag in {"system-out", "system-err"}:
+                elem.clear()
+            elif elem.tag == "testcase":
+                key = node_id(elem.attrib, granularity, modules)
+                report[key] = report.get(key, 0.0) + float(elem.attrib.get("time") or 0.0)
+                elem.clear()
+        for key, seconds in report.items():
+            totals[key] = totals.get(key, 0.0) + seconds
+            seen[key] = seen.get(key, 0) + 1
+    return {key: totals[key] / seen[key] for key in totals}
+
+
+def estimate(tests: Iterable[str], durations: dict[str, float]) -> dict[str, float]:
+    """Attach a duration to every test; unseen ones get the median known duration.
+
+    The median is taken over tests that still exist, so removed slow tests do not
+    inflate the estimate for new ones.
+    """
+    tests = list(tests)
+    known = [durations[test] for test in tests if test in durations] or list(durations.values())
+    fallback = statistics.median(known) if known else DEFAULT_SECONDS
+    return {test: durations.get(test, fallback) for test in tests}
+
+
+def partition(durations: dict[str, float], shards: int) -> list[Shard]:
+    """Greedy longest-processing-time split: each test goes to the least loaded shard."""
+    result = [Shard(index=i) for i in range(shards)]
+    heap = [(0.0, i) for i in range(shards)]
+    for test, seconds in sorted(durations.items(), key=lambda item: (-item[1], item[0])):
+        load, index = heapq.heappop(heap)
+        shard = result[index]
+        shard.tests.append(test)
+        shard.seconds = load + seconds
+        heapq.heappush(heap, (shard.seconds, index))
+    for shard in result:
+        shard.tests.sort()
+    return result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Split tests into duration-balanced shards")
+    parser.add_argument(
+        "--junit",
+        action="append",
+        default=[],
+        help="Previous JUnit XML report; repeat or use a glob",
+    )
+    parser.add_argument("--shards", type=int, required=True)
+    parser.add_argument("--index", type=int, default=None, help="Shard to select (0-based)")
+    parser.add_argument("--granularity", choices=["file", "test"], default="file")
+    parser.add_argument("--test-dir", default=None, help="Discover test files to shard")
+    parser.add_argument(
+        "--tests-file",
+        default=None,
+        help="Test ids to shard, one per line (e.g. `pytest --collect-only -q` output)",
+    )
+    parser.add_argument("--plan", default=None, help="Write every shard as JSON")
+    parser.add_argument("--list", default=None, help="Write the selected shard, one id per line")
+    parser.add_argument("--outputs", default=None, help="Append values to $GITHUB_OUTPUT")
+    args = parser.parse_args()
+    if args.shards < 1:
+        parser.error("--shards must be at least 1")
+    if args.index is not None and not 0 <= args.index < args.shards:
+        parser.error("--index must be in [0, --shards)")
+    if args.granularity == "test" and not args.tests_file:
+        # Only a collected id list shows which tests exist now: timings alone miss
+        # new tests and keep removed ones.
+        parser.error("--granularity test needs --tests-file")
+
+    test_files = discover_test_files(args.test_dir) if args.test_dir else []
+    collected: list[str] = []
+    if args.tests_file:
+        lines = Path(args.tests_file).read_text(encoding="utf-8").splitlines()
+        collected = [line.strip() for line in lines if "::" in line or line.strip().endswith(".py")]
+        test_files = list(dict.fromkeys([*test_files, *(t.split("::", 1)[0] for t in collected)]))
+    modules = {Path(f).with_suffix("").as_posix().replace("/", "."): f for f in test_files}
+    durations = load_durations(expand_inputs(args.junit), args.granularity, modules)
+
+    if collected and args.granularity == "file":
+        # Durations are keyed by file, so node ids are sharded as their files.
+        tests = list(dict.fromkeys(t.split("::", 1)[0] for t in collected))
+    elif collected:
+        tests = collected
+    elif test_files:
+        tests = test_files
+    else:
+        tests = list(durations)
+    shards = partition(estimate(tests, durations), args.shards)
+    unseen = sum(test not in durations for test in tests)
+
+    if args.plan:
+        Path(args.plan).write_text(
+            json.dumps([asdict(shard) for shard in shards], indent=2), encoding="utf-8"
+        )
+    for shard in shards:
+        print(
+            f"shard {shard.index}: {len(shard.tests)} tests, ~{shard.seconds:.1f}s",
+            file=sys.stderr,
+        )
+    print(f"{unseen} of {len(tests)} tests had no recorded duration", file=sys.stderr)
+
+    selected = shards[args.index] if args.index is not None else None
+    if selected is not None and args.list:
+        Path(args.list).write_text("".join(f"{t}\n" for t in selected.tests), encoding="utf-8")
+    if args.outputs:
+        with Path(args.outputs).open("a", encoding="utf-8") as f:
+            f.write(f"matrix={json.dumps(list(range(args.shards)))}\n")
+            if selected is not None:
+                f.write(f"tests={' '.join(selected.tests)}\n")
+                f.write(f"expected_seconds={selected.seconds:.1f}\n")
+            if args.plan:
+                f.write(f"plan_file={args.plan}\n")
+            if args.list:
+                f.write(f"list_file={args.list}\n")
+
+
+if __name__ == "__main__":
+    main()
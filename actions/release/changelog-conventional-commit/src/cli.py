@@ -18,13 +18,16 @@ import argparse
 import os
 import re
 import subprocess
+import sys
 from collections import defaultdict
 from pathlib import Path
 from typing import Any
 
-from jinja2 import Environment, FileSystemLoader
-
 HERE = Path(__file__).parent
+# Template loading is shared with the other actions that render markdown.
+sys.path.insert(0, str(HERE.parents[2] / "_lib"))
+from loom_templates import load_template  # noqa: E402
+
 DEFAULT_TEMPLATE = str(HERE / "templates" / "report.md.j2")
 
 
@@ -200,13 +203,7 @@ def render(
     pr_number: int | None,
 ) -> str:
     """Render the changelog using Jinja2 template."""
-    env = Environment(
-        loader=FileSystemLoader(Path(template_path).parent),
-        autoescape=False,
-        trim_blocks=True,
-        lstrip_blocks=True,
-    )
-    template = env.get_template(Path(template_path).name)
+    template = load_template(template_path)
     return template.render(
         version=version,
         commits=commits,
@@ -0,0 +1,320 @@
+from jinja2.runtime import LoopContext, Macro, Markup, Namespace, TemplateNotFound, TemplateReference, TemplateRuntimeError, Undefined, escape, identity, internalcode, markup_join, missing, str_join
+name = 'report.md.j2'
+
+def root(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    l_0_is_unreleased = resolve('is_unreleased')
+    l_0_squash = resolve('squash')
+    l_0_version = resolve('version')
+    l_0_pr_number = resolve('pr_number')
+    l_0_repo_url = resolve('repo_url')
+    l_0_commits = resolve('commits')
+    l_0_render_items = missing
+    pass
+    if ((undefined(name='is_unreleased') if l_0_is_unreleased is missing else l_0_is_unreleased) and (undefined(name='squash') if l_0_squash is missing else l_0_squash)):
+        pass
+        yield '# ✨ '
+        yield str((undefined(name='version') if l_0_version is missing else l_0_version))
+        yield ' ([#'
+        yield str((undefined(name='pr_number') if l_0_pr_number is missing else l_0_pr_number))
+        yield ']('
+        yield str((undefined(name='repo_url') if l_0_repo_url is missing else l_0_repo_url))
+        yield '/pull/'
+        yield str((undefined(name='pr_number') if l_0_pr_number is missing else l_0_pr_number))
+        yield ')) ([`'
+        yield str(environment.getattr((undefined(name='squash') if l_0_squash is missing else l_0_squash), 'sha'))
+        yield '`]('
+        yield str((undefined(name='repo_url') if l_0_repo_url is missing else l_0_repo_url))
+        yield '/commit/'
+        yield str(environment.getattr((undefined(name='squash') if l_0_squash is missing else l_0_squash), 'sha_full'))
+        yield '))\n'
+    elif ((not (undefined(name='is_unreleased') if l_0_is_unreleased is missing else l_0_is_unreleased)) and (undefined(name='squash') if l_0_squash is missing else l_0_squash)):
+        pass
+        yield '# 🚀 Release '
+        yield str((undefined(name='version') if l_0_version is missing else l_0_version))
+        yield ' ([#'
+        yield str((undefined(name='pr_number') if l_0_pr_number is missing else l_0_pr_number))
+        yield ']('
+        yield str((undefined(name='repo_url') if l_0_repo_url is missing else l_0_repo_url))
+        yield '/pull/'
+        yield str((undefined(name='pr_number') if l_0_pr_number is missing else l_0_pr_number))
+        yield ')) ([`'
+        yield str(environment.getattr((undefined(name='squash') if l_0_squash is missing else l_0_squash), 'sha'))
+        yield '`]('
+        yield str((undefined(name='repo_url') if l_0_repo_url is missing else l_0_repo_url))
+        yield '/commit/'
+        yield str(environment.getattr((undefined(name='squash') if l_0_squash is missing else l_0_squash), 'sha_full'))
+        yield '))\n'
+    elif (((undefined(name='is_unreleased') if l_0_is_unreleased is missing else l_0_is_unreleased) and (not (undefined(name='squash') if l_0_squash is missing else l_0_squash))) and (undefined(name='pr_number') if l_0_pr_number is missing else l_0_pr_number)):
+        pass
+        yield '# ✨ '
+        yield str((undefined(name='version') if l_0_version is missing else l_0_version))
+        yield ' ([#'
+        yield str((undefined(name='pr_number') if l_0_pr_number is missing else l_0_pr_number))
+        yield ']('
+        yield str((undefined(name='repo_url') if l_0_repo_url is missing else l_0_repo_url))
+        yield '/pull/'
+        yield str((undefined(name='pr_number') if l_0_pr_number is missing else l_0_pr_number))
+        yield '))\n'
+    elif ((undefined(name='is_unreleased') if l_0_is_unreleased is missing else l_0_is_unreleased) and (not (undefined(name='squash') if l_0_squash is missing else l_0_squash))):
+        pass
+        yield '# ✨ '
+        yield str((undefined(name='version') if l_0_version is missing else l_0_version))
+        yield '\n'
+    else:
+        pass
+        yield '# 🚀 '
+        yield str((undefined(name='version') if l_0_version is missing else l_0_version))
+        yield '\n'
+    yield '\n'
+    def macro(l_1_items, l_1_squash):
+        t_1 = []
+        if l_1_items is missing:
+            l_1_items = undefined("parameter 'items' was not provided", name='items')
+        if l_1_squash is missing:
+            l_1_squash = undefined("parameter 'squash' was not provided", name='squash')
+        pass
+        for l_2_c in l_1_items:
+            _loop_vars = {}
+            pass
+            t_1.append(
+                '- ',
+            )
+            if (environment.getattr(l_2_c, 'scope') != '(no scope)'):
+                pass
+                t_1.extend((
+                    '**',
+                    str(environment.getattr(l_2_c, 'scope')),
+                    ':** ',
+                ))
+            t_1.append(
+                str(environment.getattr(l_2_c, 'title')),
+            )
+            if ((not l_1_squash) and environment.getattr(l_2_c, 'sha')):
+                pass
+                t_1.extend((
+                    '([`',
+                    str(environment.getattr(l_2_c, 'sha')),
+                    '`](',
+                    str((undefined(name='repo_url') if l_0_repo_url is missing else l_0_repo_url)),
+                    '/commit/',
+                    str(environment.getattr(l_2_c, 'sha_full')),
+                    '))',
+                ))
+            if ((not l_1_squash) and (undefined(name='pr_number') if l_0_pr_number is missing else l_0_pr_number)):
+                pass
+                t_1.extend((
+                    ' ([files](',
+                    str((undefined(name='repo_url') if l_0_repo_url is missing else l_0_repo_url)),
+                    '/pull/',
+                    str((undefined(name='pr_number') if l_0_pr_number is missing else l_0_pr_number)),
+                    '/files))',
+                ))
+            if environment.getattr(l_2_c, 'body'):
+                pass
+                t_1.append(
+                    '<br>\n',
+                )
+                for l_3_line in context.call(environment.getattr(environment.getattr(l_2_c, 'body'), 'splitlines'), _loop_vars=_loop_vars):
+                    _loop_vars = {}
+                    pass
+                    if context.call(environment.getattr(l_3_line, 'startswith'), '- ', _loop_vars=_loop_vars):
+                        pass
+                        t_1.extend((
+                            '  - ',
+                            str(l_3_line[2:]),
+                            '\n',
+                        ))
+                    else:
+                        pass
+                        t_1.extend((
+                            '  > ',
+                            str(l_3_line),
+                            '\n',
+                        ))
+                l_3_line = missing
+            t_1.append(
+                '\n',
+            )
+        l_2_c = missing
+        return concat(t_1)
+    context.exported_vars.add('render_items')
+    context.vars['render_items'] = l_0_render_items = Macro(environment, macro, 'render_items', ('items', 'squash'), False, False, False, context.eval_ctx.autoescape)
+    yield '\n'
+    if context.call(environment.getattr((undefined(name='commits') if l_0_commits is missing else l_0_commits), 'get'), 'feat'):
+        pass
+        yield '## ✨ Features\n'
+        if context.call(environment.getattr(environment.getitem((undefined(name='commits') if l_0_commits is missing else l_0_commits), 'feat'), 'get'), '(no scope)'):
+            pass
+            yield str(context.call((undefined(name='render_items') if l_0_render_items is missing else l_0_render_items), environment.getitem(environment.getitem((undefined(name='commits') if l_0_commits is missing else l_0_commits), 'feat'), '(no scope)'), (undefined(name='squash') if l_0_squash is missing else l_0_squash)))
+            yield '\n'
+        for (l_1_scope, l_1_items) in context.call(environment.getattr(environment.getitem((undefined(name='commits') if l_0_commits is missing else l_0_commits), 'feat'), 'items')):
+            _loop_vars = {}
+            pass
+            if (l_1_scope != '(no scope)'):
+                pass
+                yield '### '
+                yield str(l_1_scope)
+                yield '\n'
+                yield str(context.call((undefined(name='render_items') if l_0_render_items is missing else l_0_render_items), l_1_items, (undefined(name='squash') if l_0_squash is missing else l_0_squash), _loop_vars=_loop_vars))
+                yield '\n'
+        l_1_scope = l_1_items = missing
+    yield '\n'
+    if context.call(environment.getattr((undefined(name='commits') if l_0_commits is missing else l_0_commits), 'get'), 'fix'):
+        pass
+        yield '## 🐛 Fixes\n'
+        if context.call(environment.getattr(environment.getitem((undefined(name='commits') if l_0_commits is missing else l_0_commits), 'fix'), 'get'), '(no scope)'):
+            pass
+            yield str(context.call((undefined(name='render_items') if l_0_render_items is missing else l_0_render_items), environment.getitem(environment.getitem((undefined(name='commits') if l_0_commits is missing else l_0_commits), 'fix'), '(no scope)'), (undefined(name='squash') if l_0_squash is missing else l_0_squash)))
+            yield '\n'
+        for (l_1_scope, l_1_items) in context.call(environment.getattr(environment.getitem((undefined(name='commits') if l_0_commits is missing else l_0_commits), 'fix'), 'items')):
+            _loop_vars = {}
+            pass
+            if (l_1_scope != '(no scope)'):
+                pass
+                yield '### '
+                yield str(l_1_scope)
+                yield '\n'
+                yield str(context.call((undefined(name='render_items') if l_0_render_items is missing else l_0_render_items), l_1_items, (undefined(name='squash') if l_0_squash is missing else l_0_squash), _loop_vars=_loop_vars))
+                yield '\n'
+        l_1_scope = l_1_items = missing
+    yield '\n'
+    if context.call(environment.getattr((undefined(name='commits') if l_0_commits is missing else l_0_commits), 'get'), 'docs'):
+        pass
+        yield '## 📖 Documentation\n'
+        if context.call(environment.getattr(environment.getitem((undefined(name='commits') if l_0_commits is missing else l_0_commits), 'docs'), 'get'), '(no scope)'):
+            pass
+            yield str(context.call((undefined(name='render_items') if l_0_render_items is missing else l_0_render_items), environment.getitem(environment.getitem((undefined(name='commits') if l_0_commits is missing else l_0_commits), 'docs'), '(no scope)'), (undefined(name='squash') if l_0_squash is missing else l_0_squash)))
+            yield '\n'
+        for (l_1_scope, l_1_items) in context.call(environment.getattr(environment.getitem((undefined(name='commits') if l_0_commits is missing else l_0_commits), 'docs'), 'items')):
+            _loop_vars = {}
+            pass
+            if (l_1_scope != '(no scope)'):
+                pass
+                yield '### '
+                yield str(l_1_scope)
+                yield '\n'
+                yield str(context.call((undefined(name='render_items') if l_0_render_items is missing else l_0_render_items), l_1_items, (undefined(name='squash') if l_0_squash is missing else l_0_squash), _loop_vars=_loop_vars))
+                yield '\n'
+        l_1_scope = l_1_items = missing
+    yield '\n'
+    if context.call(environment.getattr((undefined(name='commits') if l_0_commits is missing else l_0_commits), 'get'), 'style'):
+        pass
+        yield '## 🎨 Style\n'
+        if context.call(environment.getattr(environment.getitem((undefined(name='commits') if l_0_commits is missing else l_0_commits), 'style'), 'get'), '(no scope)'):
+            pass
+            yield str(context.call((undefined(name='render_items') if l_0_render_items is missing else l_0_render_items), environment.getitem(environment.getitem((undefined(name='commits') if l_0_commits is missing else l_0_commits), 'style'), '(no scope)'), (undefined(name='squash') if l_0_squash is missing else l_0_squash)))
+            yield '\n'
+        for (l_1_scope, l_1_items) in context.call(environment.getattr(environment.getitem((undefined(name='commits') if l_0_commits is missing else l_0_commits), 'style'), 'items')):
+            _loop_vars = {}
+            pass
+            if (l_1_scope != '(no scope)'):
+                pass
+                yield '### '
+                yield str(l_1_scope)
+                yield '\n'
+                yield str(context.call((undefined(name='render_items') if l_0_render_items is missing else l_0_render_items), l_1_items, (undefined(name='squash') if l_0_squash is missing else l_0_squash), _loop_vars=_loop_vars))
+                yield '\n'
+        l_1_scope = l_1_items = missing
+    yield '\n'
+    if context.call(environment.getattr((undefined(name='commits') if l_0_commits is missing else l_0_commits), 'get'), 'refactor'):
+        pass
+        yield '## ♻️ Refactor\n'
+        if context.call(environment.getattr(environment.getitem((undefined(name='commits') if l_0_commits is missing else l_0_commits), 'refactor'), 'get'), '(no scope)'):
+            pass
+            yield str(context.call((undefined(name='render_items') if l_0_render_items is missing else l_0_render_items), environment.getitem(environment.getitem((undefined(name='commits') if l_0_commits is missing else l_0_commits), 'refactor'), '(no scope)'), (undefined(name='squash') if l_0_squash is missing else l_0_squash)))
+            yield '\n'
+        for (l_1_scope, l_1_items) in context.call(environment.getattr(environment.getitem((undefined(name='commits') if l_0_commits is missing else l_0_commits), 'refactor'), 'items')):
+            _loop_vars = {}
+            pass
+            if (l_1_scope != '(no scope)'):
+                pass
+                yield '### '
+                yield str(l_1_scope)
+                yield '\n'
+                yield str(context.call((undefined(name='render_items') if l_0_render_items is missing else l_0_render_items), l_1_items, (undefined(name='squash') if l_0_squash is missing else l_0_squash), _loop_vars=_loop_vars))
+                yield '\n'
+        l_1_scope = l_1_items = missing
+    yield '\n'
+    if context.call(environment.getattr((undefined(name='commits') if l_0_commits is missing else l_0_commits), 'get'), 'perf'):
+        pass
+        yield '## ⚡ Performance\n'
+        if context.call(environment.getattr(environment.getitem((undefined(name='commits') if l_0_commits is missing else l_0_commits), 'perf'), 'get'), '(no scope)'):
+            pass
+            yield str(context.call((undefined(name='render_items') if l_0_render_items is missing else l_0_render_items), environment.getitem(environment.getitem((undefined(name='commits') if l_0_commits is missing else l_0_commits), 'perf'), '(no scope)'), (undefined(name='squash') if l_0_squash is missing else l_0_squash)))
+            yield '\n'
+        for (l_1_scope, l_1_items) in context.call(environment.getattr(environment.getitem((undefined(name='commits') if l_0_commits is missing else l_0_commits), 'perf'), 'items')):
+            _loop_vars = {}
+            pass
+            if (l_1_scope != '(no scope)'):
+                pass
+                yield '### '
+                yield str(l_1_scope)
+                yield '\n'
+                yield str(context.call((undefined(name='render_items') if l_0_render_items is missing else l_0_render_items), l_1_items, (undefined(name='squash') if l_0_squash is missing else l_0_squash), _loop_vars=_loop_vars))
+                yield '\n'
+        l_1_scope = l_1_items = missing
+    yield '\n'
+    if context.call(environment.getattr((undefined(name='commits') if l_0_commits is missing else l_0_commits), 'get'), 'test'):
+        pass
+        yield '## ✅ Tests\n'
+        if context.call(environment.getattr(environment.getitem((undefined(name='commits') if l_0_commits is missing else l_0_commits), 'test'), 'get'), '(no scope)'):
+            pass
+            yield str(context.call((undefined(name='render_items') if l_0_render_items is missing else l_0_render_items), environment.getitem(environment.getitem((undefined(name='commits') if l_0_commits is missing else l_0_commits), 'test'), '(no scope)'), (undefined(name='squash') if l_0_squash is missing else l_0_squash)))
+            yield '\n'
+        for (l_1_scope, l_1_items) in context.call(environment.getattr(environment.getitem((undefined(name='commits') if l_0_commits is missing else l_0_commits), 'test'), 'items')):
+            _loop_vars = {}
+            pass
+            if (l_1_scope != '(no scope)'):
+                pass
+                yield '### '
+                yield str(l_1_scope)
+                yield '\n'
+                yield str(context.call((undefined(name='render_items') if l_0_render_items is missing else l_0_render_items), l_1_items, (undefined(name='squash') if l_0_squash is missing else l_0_squash), _loop_vars=_loop_vars))
+                yield '\n'
+        l_1_scope = l_1_items = missing
+    yield '\n'
+    if context.call(environment.getattr((undefined(name='commits') if l_0_commits is missing else l_0_commits), 'get'), 'chore'):
+        pass
+        yield '## 🛠 Chores\n'
+        if context.call(environment.getattr(environment.getitem((undefined(name='commits') if l_0_commits is missing else l_0_commits), 'chore'), 'get'), '(no scope)'):
+            pass
+            yield str(context.call((undefined(name='render_items') if l_0_render_items is missing else l_0_render_items), environment.getitem(environment.getitem((undefined(name='commits') if l_0_commits is missing else l_0_commits), 'chore'), '(no scope)'), (undefined(name='squash') if l_0_squash is missing else l_0_squash)))
+            yield '\n'
+        for (l_1_scope, l_1_items) in context.call(environment.getattr(environment.getitem((undefined(name='commits') if l_0_commits is missing else l_0_commits), 'chore'), 'items')):
+            _loop_vars = {}
+            pass
+            if (l_1_scope != '(no scope)'):
+                pass
+                yield '### '
+                yield str(l_1_scope)
+                yield '\n'
+                yield str(context.call((undefined(name='render_items') if l_0_render_items is missing else l_0_render_items), l_1_items, (undefined(name='squash') if l_0_squash is missing else l_0_squash), _loop_vars=_loop_vars))
+                yield '\n'
+        l_1_scope = l_1_items = missing
+    yield '\n'
+    if context.call(environment.getattr((undefined(name='commits') if l_0_commits is missing else l_0_commits), 'get'), 'other'):
+        pass
+        yield '## 🔖 Other\n'
+        if context.call(environment.getattr(environment.getitem((undefined(name='commits') if l_0_commits is missing else l_0_commits), 'other'), 'get'), '(no scope)'):
+            pass
+            yield str(context.call((undefined(name='render_items') if l_0_render_items is missing else l_0_render_items), environment.getitem(environment.getitem((undefined(name='commits') if l_0_commits is missing else l_0_commits), 'other'), '(no scope)'), (undefined(name='squash') if l_0_squash is missing else l_0_squash)))
+            yield '\n'
+        for (l_1_scope, l_1_items) in context.call(environment.getattr(environment.getitem((undefined(name='commits') if l_0_commits is missing else l_0_commits), 'other'), 'items')):
+            _loop_vars = {}
+            pass
+            if (l_1_scope != '(no scope)'):
+                pass
+                yield '### '
+                yield str(l_1_scope)
+                yield '\n'
+                yield str(context.call((undefined(name='render_items') if l_0_render_items is missing else l_0_render_items), l_1_items, (undefined(name='squash') if l_0_squash is missing else l_0_squash), _loop_vars=_loop_vars))
+                yield '\n'
+        l_1_scope = l_1_items = missing
+
+blocks = {}
+debug_info = '1=18&2=21&3=35&4=38&5=52&6=55&7=63&8=66&10=71&13=74&14=81&15=87&16=108&17=117&18=122&19=125&20=129&22=136&30=148&32=151&33=153&35=155&36=158&37=161&38=163&43=167&45=170&46=172&48=174&49=177&50=180&51=182&56=186&58=189&59=191&61=193&62=196&63=199&64=201&69=205&71=208&72=210&74=212&75=215&76=218&77=220&82=224&84=227&85=229&87=231&88=234&89=237&90=239&95=243&97=246&98=248&100=250&101=253&102=256&103=258&108=262&110=265&111=267&113=269&114=272&115=275&116=277&121=281&123=284&124=286&126=288&127=291&128=294&129=296&134=300&136=303&137=305&139=307&140=310&141=313&142=315'
\ No newline at end of file
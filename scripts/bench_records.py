@@ -0,0 +1,121 @@
+"""Compare the quality-report record types against plain dataclasses + ``asdict``.
+
+Builds ``--records`` synthetic failed tests and bandit issues (``make bench-records``)
+and reports, for each implementation, the memory the records hold and the time and
+peak memory of encoding every one of them to compact JSON, as the NDJSON export and
+the summary's findings list do.
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import importlib.util
+import json
+import sys
+import time
+import tracemalloc
+from collections.abc import Callable
+from dataclasses import asdict, fields, make_dataclass
+from pathlib import Path
+from typing import Any
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+BUILDER = REPO_ROOT / "actions/python/quality-report/src/builder.py"
+
+
+def load_builder() -> Any:
+    spec = importlib.util.spec_from_file_location("quality_builder", BUILDER)
+    assert spec is not None and spec.loader is not None
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def plain(cls: type) -> type:
+    """The same record without slots, as the builder declared it before."""
+    return make_dataclass(cls.__name__, [(f.name, f.type) for f in fields(cls)])
+
+
+def make_records(failed_cls: type, issue_cls: type, count: int) -> list[tuple[str, Any]]:
+    records: list[tuple[str, Any]] = []
+    for i in range(count // 2):
+        records.append(
+            (
+                "pytest",
+                failed_cls(nodeid=f"tests/test_mod{i % 400}.py::test_case_{i}", message=f"E {i}"),
+            )
+        )
+        records.append(
+            (
+                "bandit",
+                issue_cls(
+                    filename=f"src/pkg/mod{i % 400}.py",
+                    line_number=i % 900 + 1,
+                    severity="MEDIUM",
+                    confidence="HIGH",
+                    test_id="B602",
+                    test_name="subprocess_popen_with_shell_equals_true",
+                    issue_text=f"subprocess call with shell=True identified {i}",
+                ),
+            )
+        )
+    return records
+
+
+def measure(label: str, build: Callable[[], list[tuple[str, Any]]], encode: Callable) -> str:
+    gc.collect()
+    tracemalloc.start()
+    records = build()
+    held = tracemalloc.get_traced_memory()[0]
+    tracemalloc.reset_peak()
+    lines = [encode(tool, record) for tool, record in records]
+    peak = tracemalloc.get_traced_memory()[1] - held
+    tracemalloc.stop()
+    # Timed again without tracemalloc, whose hooks slow allocation-heavy code down.
+    started = time.perf_counter()
+    for tool, record in records:
+        encode(tool, record)
+    seconds = time.perf_counter() - started
+    size = sum(map(len, lines))
+    return (
+        f"{label:<22} records {held / 2**20:7.1f} MiB   encode {seconds:6.3f}s"
+        f"   encode peak {peak / 2**20:7.1f} MiB   output {size / 2**20:6.1f} MiB"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--records", type=int, default=200_000)
+    args = parser.parse_args()
+
+    builder = load_builder()
+    old_failed, old_issue = plain(builder.FailedTest), plain(builder.BanditIssue)
+    encoder = json.JSONEncoder(ensure_ascii=False, separators=(",", ":")).encode
+
+    def old_encode(tool: str, record: Any) -> str:
+        return encoder({"tool": tool, **asdict(record)})
+
+    def new_encode(tool: str, record: Any) -> str:
+        return builder.encode_record(record, tool=tool)
+
+    print(f"{args.records} records (half failed tests, half bandit issues)")
+    print(
+        measure(
+            "dataclass + asdict",
+            lambda: make_records(old_failed, old_issue, args.records),
+            old_encode,
+        )
+    )
+    print(
+        measure(
+            "slots + encode_record",
+            lambda: make_records(builder.FailedTest, builder.BanditIssue, args.records),
+            new_encode,
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
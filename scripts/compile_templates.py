@@ -0,0 +1,57 @@
+"""Precompile the bundled Jinja templates of every action into Python modules.
+
+Run at release time (``make compile-templates``). Each ``src/templates`` directory
+gets a ``compiled/`` sibling holding one module per template plus a manifest with
+the Jinja series and the source digest of every template, so the runtime loaders
+can tell whether the compiled code is still valid.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import shutil
+import sys
+from pathlib import Path
+
+import jinja2
+from jinja2 import Environment, FileSystemLoader
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+# The options are baked into the compiled code, so they come from the runtime loader.
+sys.path.insert(0, str(REPO_ROOT / "actions" / "_lib"))
+from loom_templates import TEMPLATE_OPTIONS as ENV_OPTIONS  # noqa: E402
+
+
+def jinja_series() -> str:
+    return ".".join(jinja2.__version__.split(".")[:2])
+
+
+def compile_directory(templates_dir: Path) -> list[str]:
+    target = templates_dir / "compiled"
+    shutil.rmtree(target, ignore_errors=True)
+
+    env = Environment(loader=FileSystemLoader(str(templates_dir)), **ENV_OPTIONS)
+    names = env.list_templates(extensions=["j2"])
+    env.compile_templates(str(target), filter_func=lambda name: name in names, zip=None)
+
+    manifest = {
+        "jinja2": jinja_series(),
+        "templates": {
+            name: hashlib.sha256((templates_dir / name).read_bytes()).hexdigest() for name in names
+        },
+    }
+    (target / "manifest.json").write_text(
+        json.dumps(manifest, indent=2, sort_keys=True) + "\n", encoding="utf-8"
+    )
+    return names
+
+
+def main() -> None:
+    for templates_dir in sorted(REPO_ROOT.glob("actions/*/*/src/templates")):
+        for name in compile_directory(templates_dir):
+            print(f"compiled {templates_dir.relative_to(REPO_ROOT) / name}")
+
+
+if __name__ == "__main__":
+    main()
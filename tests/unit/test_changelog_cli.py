@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import importlib.util
+import sys
 from pathlib import Path
 
 
@@ -99,3 +100,15 @@ def test_render_hides_no_scope_heading_and_shows_unscoped_first() -> None:
 
     assert "### (no scope)" not in markdown
     assert markdown.index("unscoped change") < markdown.index("### api")
+
+
+def test_bundled_templates_match_their_precompiled_modules() -> None:
+    _load_changelog_cli_module()
+    templates = sys.modules["loom_templates"]
+    repo_root = Path(__file__).resolve().parents[2]
+    stale = [
+        str(template.relative_to(repo_root))
+        for template in sorted(repo_root.glob("actions/*/*/src/templates/*.j2"))
+        if templates.compiled_templates_dir(template) is None
+    ]
+    assert stale == [], "run `make compile-templates` after editing bundled templates"
@@ -1,10 +1,16 @@
 from __future__ import annotations
 
+import importlib.util
+import io
 import json
 import subprocess
 import sys
+import time
+from collections import Counter
 from pathlib import Path
 
+import pytest
+
 RUFF_JSON = """[
   {
     "code": "F401",
@@ -95,6 +101,17 @@ bandit\tbandit -r src -f json -o bandit.json\t0\tpass\tbandit.json
 """
 
 
+def _load_builder_module():
+    repo_root = Path(__file__).resolve().parents[2]
+    module_path = repo_root / "actions/python/quality-report/src/builder.py"
+    spec = importlib.util.spec_from_file_location("quality_builder", module_path)
+    assert spec is not None and spec.loader is not None
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
 def _write_fixture_files(target_dir: Path) -> None:
     (target_dir / "ruff.json").write_text(RUFF_JSON, encoding="utf-8")
     (target_dir / "pyright.json").write_text(PYRIGHT_JSON, encoding="utf-8")
@@ -109,18 +126,23 @@ def _run_builder(
     fail_on_quality: str,
     fail_on_security: str,
     threshold: str,
+    extra_args: tuple[str, ...] = (),
+    write_fixtures: bool = True,
+    python_args: tuple[str, ...] = (),
 ) -> subprocess.CompletedProcess[str]:
     repo_root = Path(__file__).resolve().parents[2]
     builder = repo_root / "actions/python/quality-report/src/builder.py"
     template = repo_root / "actions/python/quality-report/src/templates/report.md.j2"
 
-    _write_fixture_files(tmp_path)
+    if write_fixtures:
+        _write_fixture_files(tmp_path)
 
     outputs_file = tmp_path / "gh_outputs.txt"
     outputs_file.write_text("", encoding="utf-8")
 
     cmd = [
         sys.executable,
+        *python_args,
         str(builder),
         "--ruff",
         str(tmp_path / "ruff.json"),
@@ -148,6 +170,7 @@ def _run_builder(
         fail_on_quality,
         "--fail-on-security",
         fail_on_security,
+        *extra_args,
     ]
     return subprocess.run(cmd, cwd=tmp_path, capture_output=True, text=True, check=False)
 
@@ -193,3 +216,864 @@ def test_builder_passes_when_fail_modes_are_none(tmp_path: Path) -> None:
     outputs_text = (tmp_path / "gh_outputs.txt").read_text(encoding="utf-8")
     assert "blocking=false" in outputs_text
     assert "coverage=66.67" in outputs_text
+
+
+def test_parse_junit_streams_large_suites_with_bounded_failures(tmp_path: Path) -> None:
+    builder = _load_builder_module()
+    cases = "".join(
+        f'<testcase classname="tests.test_big" name="test_{i}" file="tests/test_big.py">'
+        f'<failure message="boom {i}">trace</failure>'
+        f"<system-out>{'x' * 1000}</system-out></testcase>"
+        for i in range(200)
+    )
+    junit = tmp_path / "junit.xml"
+    junit.write_text(
+        "<testsuites>"
+        f'<testsuite name="pytest" tests="200" failures="200" errors="0" skipped="0">{cases}'
+        "<system-err>noise</system-err></testsuite></testsuites>",
+        encoding="utf-8",
+    )
+
+    total, failed, skipped, failures = builder.parse_junit(str(junit), limit=3)
+
+    assert (total, failed, skipped) == (200, 200, 0)
+    assert [f.nodeid for f in failures] == [
+        "tests/test_big.py::test_0",
+        "tests/test_big.py::test_1",
+        "tests/test_big.py::test_2",
+    ]
+    assert failures[0].message == "boom 0"
+
+
+def test_parse_ruff_counts_all_findings_and_accepts_json_lines(tmp_path: Path) -> None:
+    builder = _load_builder_module()
+    findings = [
+        {
+            "code": "F401",
+            "filename": f"src/mod_{i}.py",
+            "location": {"row": i, "column": 1},
+            "message": "unused import",
+        }
+        for i in range(120)
+    ]
+    as_array = tmp_path / "ruff.json"
+    as_array.write_text(json.dumps(findings, indent=2), encoding="utf-8")
+    as_lines = tmp_path / "ruff.jsonl"
+    as_lines.write_text("\n".join(json.dumps(f) for f in findings) + "\n", encoding="utf-8")
+
+    for path in (as_array, as_lines):
+        count, sample, top_files, _ = builder.parse_ruff(str(path), limit=5)
+        assert count == 120
+        assert [f["filename"] for f in sample] == [f"src/mod_{i}.py" for i in range(5)]
+        assert top_files == [(f"src/mod_{i}.py", 1) for i in range(5)]
+
+
+def test_json_stream_walks_documents_across_chunk_boundaries() -> None:
+    builder = _load_builder_module()
+    doc = {"summary": {"errorCount": 12345}, "generalDiagnostics": [{"n": i} for i in range(50)]}
+    stream = builder.JsonStream(io.BytesIO(json.dumps(doc).encode("utf-8")), chunk_size=7)
+
+    seen: dict[str, object] = {}
+    for key in stream.items():
+        if key == "generalDiagnostics":
+            seen[key] = [stream.value()["n"] for _ in stream.elements()]
+        else:
+            seen[key] = stream.value()
+
+    assert seen == {"summary": {"errorCount": 12345}, "generalDiagnostics": list(range(50))}
+    assert stream.peek() == ""
+
+
+def test_json_stream_decodes_numbers_split_at_any_chunk_size() -> None:
+    builder = _load_builder_module()
+    numbers = [1.5, -2e10, 3.25e-7, 12345, 0.5e3, -0.0, 1e100, 987654321]
+    lines = "\n".join(["1.5", "-2e10", "3.25E-7", "12345", "0.5e+3", "-0.0", "1E100", "987654321"])
+    array_doc = json.dumps(numbers)
+
+    for chunk_size in range(1, len(lines) + 2):
+        stream = builder.JsonStream(io.BytesIO(lines.encode()), chunk_size=chunk_size)
+        assert list(stream.values()) == numbers, chunk_size
+        stream = builder.JsonStream(io.BytesIO(array_doc.encode()), chunk_size=chunk_size)
+        assert [stream.value() for _ in stream.elements()] == numbers, chunk_size
+
+
+def test_open_artifact_reads_once_and_picks_mode_by_size(tmp_path: Path, monkeypatch) -> None:
+    builder = _load_builder_module()
+    bandit = tmp_path / "bandit.json"
+    bandit.write_text(BANDIT_JSON, encoding="utf-8")
+    size = bandit.stat().st_size
+
+    builder.ARTIFACT_STATS.clear()
+    assert builder.parse_bandit(str(bandit), "none")[0] == 1
+    monkeypatch.setattr(builder, "SMALL_ARTIFACT_BYTES", 0)
+    assert builder.parse_bandit(str(bandit), "none")[0] == 1
+    monkeypatch.setattr(builder, "STREAM_ARTIFACT_BYTES", 0)
+    assert builder.parse_bandit(str(bandit), "none")[0] == 1
+    assert builder.parse_command_results(str(tmp_path / "missing.tsv")) == []
+
+    stats = [(s.name, s.mode, s.bytes_read) for s in builder.ARTIFACT_STATS]
+    assert stats == [
+        ("bandit", "memory", size),
+        ("bandit", "mmap", size),
+        ("bandit", "stream", size),
+        ("commands", "missing", 0),
+    ]
+
+
+def test_builder_parallel_parsing_matches_serial(tmp_path: Path) -> None:
+    summaries = []
+    for jobs in ("1", "3"):
+        run_dir = tmp_path / f"jobs-{jobs}"
+        run_dir.mkdir()
+        result = _run_builder(
+            tmp_path=run_dir,
+            fail_on_quality="none",
+            fail_on_security="none",
+            threshold="80",
+            extra_args=("--jobs", jobs),
+        )
+        assert result.returncode == 0, result.stderr
+        summary = json.loads((run_dir / "quality_summary.json").read_text(encoding="utf-8"))
+        assert [a["name"] for a in summary.pop("artifacts")] == [
+            "commands",
+            "ruff",
+            "pyright",
+            "junit",
+            "coverage",
+            "bandit",
+        ]
+        summaries.append(summary)
+
+    assert summaries[0] == summaries[1]
+
+
+def test_coverage_missing_lines_are_stored_and_rendered_as_ranges(tmp_path: Path) -> None:
+    builder = _load_builder_module()
+    missing = [*range(12, 481), 502, 504, 505]
+    coverage = tmp_path / "coverage.json"
+    coverage.write_text(
+        json.dumps(
+            {
+                "totals": {"percent_covered": 10.0},
+                "files": {
+                    "src/big.py": {"summary": {"percent_covered": 10.0}, "missing_lines": missing}
+                },
+            }
+        ),
+        encoding="utf-8",
+    )
+
+    total, files = builder.parse_coverage(str(coverage))
+
+    assert total == 10.0
+    assert files[0].missing_ranges.tolist() == [12, 480, 502, 502, 504, 505]
+    assert files[0].missing_spans == "12-480, 502, 504-505"
+    assert json.loads(builder.encode_record(files[0]))["missing_ranges"] == [
+        [12, 480],
+        [502, 502],
+        [504, 505],
+    ]
+    assert builder.format_line_ranges(builder.compress_line_ranges(range(1, 100, 2)), 2) == (
+        "1, 3, … (+48 more)"
+    )
+
+
+def test_top_k_keeps_most_relevant_items_in_key_order() -> None:
+    builder = _load_builder_module()
+    top = builder.TopK(3, key=lambda item: item[1])
+    for item in [("a", 50.0), ("b", 10.0), ("c", 90.0), ("d", 10.0), ("e", 5.0), ("f", 70.0)]:
+        top.push(item)
+
+    assert top.seen == 6
+    assert top.items() == [("e", 5.0), ("b", 10.0), ("d", 10.0)]
+
+
+def test_bounded_sections_keep_most_severe_findings(tmp_path: Path) -> None:
+    builder = _load_builder_module()
+    results = [
+        {"filename": f"src/m{i}.py", "issue_severity": sev, "issue_confidence": "HIGH"}
+        for i, sev in enumerate(["LOW", "LOW", "HIGH", "MEDIUM", "LOW", "HIGH"])
+    ]
+    bandit = tmp_path / "bandit.json"
+    bandit.write_text(json.dumps({"results": results}), encoding="utf-8")
+    diagnostics = [
+        {"file": f"src/p{i}.py", "severity": sev, "message": "m"}
+        for i, sev in enumerate(["warning", "information", "error", "warning"])
+    ]
+    pyright = tmp_path / "pyright.json"
+    pyright.write_text(json.dumps({"generalDiagnostics": diagnostics}), encoding="utf-8")
+
+    count, issues, _, _ = builder.parse_bandit(str(bandit), "none", limit=3)
+    _, _, normalized, _ = builder.parse_pyright(str(pyright), limit=2)
+
+    assert count == 6
+    assert [i.filename for i in issues] == ["src/m2.py", "src/m5.py", "src/m3.py"]
+    assert [d["file"] for d in normalized] == ["src/p2.py", "src/p0.py"]
+
+
+def test_builder_baseline_reports_and_gates_only_new_findings(tmp_path: Path) -> None:
+    base_dir = tmp_path / "base"
+    base_dir.mkdir()
+    result = _run_builder(base_dir, fail_on_quality="none", fail_on_security="none", threshold="0")
+    assert result.returncode == 0, result.stderr
+    baseline = base_dir / "quality_summary.json"
+
+    head_dir = tmp_path / "head"
+    head_dir.mkdir()
+    new_finding = {
+        "code": "F841",
+        "filename": "src/sample_pkg/module.py",
+        "location": {"row": 40, "column": 5},
+        "message": "Local variable `x` is assigned to but never used",
+    }
+    moved = json.loads(RUFF_JSON)[0] | {"location": {"row": 30, "column": 1}}
+    _write_fixture_files(head_dir)
+    (head_dir / "ruff.json").write_text(json.dumps([moved, new_finding]), encoding="utf-8")
+    builder = _load_builder_module()
+
+    result = _run_builder(
+        head_dir,
+        fail_on_quality="any",
+        fail_on_security="medium",
+        threshold="0",
+        extra_args=("--baseline", str(baseline)),
+        write_fixtures=False,
+    )
+
+    summary = json.loads((head_dir / "quality_summary.json").read_text(encoding="utf-8"))
+    assert summary["summary"]["ruff_issues"] == 1
+    sample = [summary["findings"][i] for i in summary["checks"]["ruff"]["sample"]]
+    assert sample == [{"tool": "ruff", **new_finding}]
+    assert summary["summary"]["pyright_errors"] == 0
+    assert summary["summary"]["bandit_issues"] == 0
+    assert summary["baseline"]["known"] == {"ruff": 1, "pyright": 2, "bandit": 1}
+    assert len(summary["fingerprints"]["ruff"]) == 2
+    assert builder.finding_fingerprint("ruff", moved) in summary["fingerprints"]["ruff"]
+    # The new ruff finding and the failing junit test still block.
+    assert result.returncode == 1
+    assert summary["gates"]["security_blocking"] is False
+
+
+def test_bundled_template_loads_precompiled_and_custom_uses_bytecode_cache(
+    tmp_path: Path, monkeypatch
+) -> None:
+    builder = _load_builder_module()
+    templates = sys.modules["loom_templates"]
+    repo_root = Path(__file__).resolve().parents[2]
+    bundled = repo_root / "actions/python/quality-report/src/templates/report.md.j2"
+    monkeypatch.setattr(templates, "TEMPLATE_CACHE_DIR", tmp_path / "cache")
+
+    assert templates.compiled_templates_dir(bundled) == bundled.parent / "compiled"
+    assert builder.load_template(str(bundled)).filename.startswith(str(bundled.parent / "compiled"))
+
+    custom = tmp_path / "custom.md.j2"
+    custom.write_text("{% for i in items %}{{ i }}{% endfor %}\n", encoding="utf-8")
+    assert templates.compiled_templates_dir(custom) is None
+    assert builder.load_template(str(custom)).render(items=[1, 2]) == "12"
+    assert list((tmp_path / "cache").iterdir())
+
+
+def test_builder_summary_only_skips_rendering_and_template_imports(tmp_path: Path) -> None:
+    result = _run_builder(
+        tmp_path=tmp_path,
+        fail_on_quality="none",
+        fail_on_security="none",
+        threshold="80",
+        extra_args=("--summary-only",),
+        python_args=("-X", "importtime"),
+    )
+
+    assert result.returncode == 0, result.stderr
+    assert not (tmp_path / "quality_report.md").exists()
+    summary = json.loads((tmp_path / "quality_summary.json").read_text(encoding="utf-8"))
+    assert summary["summary"]["ruff_issues"] == 1
+    assert "report_file=\n" in (tmp_path / "gh_outputs.txt").read_text(encoding="utf-8")
+    # Startup cost is asserted through what gets imported, not wall-clock time.
+    imported = {line.rsplit("|", 1)[-1].strip() for line in result.stderr.splitlines()}
+    assert "json" in imported
+    assert not {"jinja2", "markupsafe", "zstandard", "sqlite3"} & imported
+
+
+# Interpreter-to-exit budget for --summary-only, on top of a bare ``python -c pass``
+# timed on the same machine. The no-render path takes about 0.1s over that locally;
+# the slack absorbs slow CI runners while still catching eager heavyweight imports.
+SUMMARY_ONLY_OVERHEAD_SECONDS = 1.0
+
+
+def _best_elapsed(run, attempts: int = 3) -> float:
+    best = float("inf")
+    for _ in range(attempts):
+        started = time.perf_counter()
+        run()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def test_builder_summary_only_stays_within_startup_budget(tmp_path: Path) -> None:
+    _write_fixture_files(tmp_path)
+
+    def summary_only() -> None:
+        result = _run_builder(
+            tmp_path=tmp_path,
+            fail_on_quality="none",
+            fail_on_security="none",
+            threshold="80",
+            extra_args=("--summary-only",),
+            write_fixtures=False,
+        )
+        assert result.returncode == 0, result.stderr
+
+    baseline = _best_elapsed(lambda: subprocess.run([sys.executable, "-c", "pass"], check=True))
+    elapsed = _best_elapsed(summary_only)
+
+    assert (
+        elapsed - baseline < SUMMARY_ONLY_OVERHEAD_SECONDS
+    ), f"--summary-only took {elapsed:.3f}s against {baseline:.3f}s for a bare interpreter"
+
+
+def test_command_results_accept_legacy_and_timed_rows(tmp_path: Path) -> None:
+    builder = _load_builder_module()
+    status = tmp_path / "command_status.tsv"
+    status.write_text(
+        "ruff\truff check src\t1\tfail\n"
+        "bandit\tskipped\t0\tskipped\tbandit.json\n"
+        "pytest\tpytest tests\t0\tpass\tjunit.xml\t182.500\t171.250\t524288\n",
+        encoding="utf-8",
+    )
+
+    ruff, bandit, pytest_ = builder.parse_command_results(str(status))
+
+    assert (ruff.exit_code, ruff.artifacts, ruff.wall_seconds) == (1, "", None)
+    assert (bandit.artifacts, bandit.max_rss_kb) == ("bandit.json", None)
+    assert (pytest_.wall_seconds, pytest_.cpu_seconds, pytest_.max_rss_kb) == (
+        182.5,
+        171.25,
+        524288,
+    )
+
+
+def test_parse_junit_recounts_worker_suites_without_counters(tmp_path: Path) -> None:
+    builder = _load_builder_module()
+    junit = tmp_path / "junit.xml"
+    junit.write_text(
+        "<testsuites>"
+        '<testsuite name="gw0"><testcase classname="t" name="a"/>'
+        '<testcase classname="t" name="b"><failure message="boom"/></testcase></testsuite>'
+        '<testsuite name="gw1"><testcase classname="t" name="c"><skipped/></testcase>'
+        '<testcase classname="t" name="d"><error message="crash"/></testcase></testsuite>'
+        "</testsuites>",
+        encoding="utf-8",
+    )
+
+    total, failed, skipped, failures = builder.parse_junit(str(junit))
+
+    assert (total, failed, skipped) == (4, 2, 1)
+    assert [f.nodeid for f in failures] == ["t::b", "t::d"]
+
+
+def test_sharded_junit_and_coverage_inputs_are_merged(tmp_path: Path) -> None:
+    builder = _load_builder_module()
+    for shard, (name, outcome) in enumerate([("a", ""), ("b", '<failure message="boom"/>')]):
+        (tmp_path / f"junit-{shard}.xml").write_text(
+            f'<testsuite tests="2" failures="{int(bool(outcome))}" skipped="1">'
+            f'<testcase classname="t" name="{name}">{outcome}</testcase>'
+            f'<testcase classname="t" name="{name}_skip"><skipped/></testcase></testsuite>',
+            encoding="utf-8",
+        )
+    shards = [
+        {"src/a.py": ([1, 2], [3, 4]), "src/b.py": ([1], [])},
+        {"src/a.py": ([1, 3], [2, 4]), "src/c.py": ([], [5, 6])},
+    ]
+    for shard, files in enumerate(shards):
+        (tmp_path / f"coverage-{shard}.json").write_text(
+            json.dumps(
+                {
+                    "totals": {"percent_covered": 0.0},
+                    "files": {
+                        fp: {"executed_lines": ran, "missing_lines": missed}
+                        for fp, (ran, missed) in files.items()
+                    },
+                }
+            ),
+            encoding="utf-8",
+        )
+
+    paths = builder.expand_inputs([str(tmp_path / "junit-*.xml"), str(tmp_path / "junit-0.xml")])
+    assert [Path(p).name for p in paths] == ["junit-0.xml", "junit-1.xml"]
+    total, failed, skipped, failures = builder.parse_junit_files(paths)
+    assert (total, failed, skipped) == (4, 1, 2)
+    assert [f.nodeid for f in failures] == ["t::b"]
+
+    coverage_paths = builder.expand_inputs([str(tmp_path / "coverage-*.json")])
+    total, below = builder.parse_coverage_files(coverage_paths, threshold=100.0)
+    # a.py: 3 of 4 lines ran across shards; b.py: 1 of 1; c.py: 0 of 2.
+    assert total == round(100.0 * 4 / 7, 2)
+    assert [(f.path, f.percent, f.missing_spans) for f in below] == [
+        ("src/c.py", 0.0, "5-6"),
+        ("src/a.py", 75.0, "4"),
+    ]
+    assert list(builder.mask_lines(builder.line_mask([9, 1, 64]))) == [1, 9, 64]
+
+
+def test_builder_labels_changed_only_runs_as_partial(tmp_path: Path) -> None:
+    changed = tmp_path / "changed_files.txt"
+    changed.write_text("src/a.py\n./src/b.py\n\n", encoding="utf-8")
+
+    result = _run_builder(
+        tmp_path=tmp_path,
+        fail_on_quality="none",
+        fail_on_security="none",
+        threshold="80",
+        extra_args=("--changed-files", str(changed), "--changed-base", "origin/master"),
+    )
+
+    assert result.returncode == 0, result.stderr
+    summary = json.loads((tmp_path / "quality_summary.json").read_text(encoding="utf-8"))
+    assert summary["scope"] == {
+        "partial": True,
+        "base": "origin/master",
+        "changed_files": ["src/a.py", "src/b.py"],
+    }
+    report = (tmp_path / "quality_report.md").read_text(encoding="utf-8")
+    assert "Partial report" in report
+    assert "2 Python file(s) changed against `origin/master`" in report
+
+
+def test_builder_records_warm_partial_and_cold_tool_caches(tmp_path: Path) -> None:
+    result = _run_builder(
+        tmp_path=tmp_path,
+        fail_on_quality="none",
+        fail_on_security="none",
+        threshold="80",
+        extra_args=(
+            "--tool-cache",
+            "ruff=warm",
+            "--tool-cache",
+            "pyright=partial",
+            "--tool-cache",
+            "pytest=cold",
+        ),
+    )
+
+    assert result.returncode == 0, result.stderr
+    summary = json.loads((tmp_path / "quality_summary.json").read_text(encoding="utf-8"))
+    assert summary["tool_cache"] == {"ruff": "warm", "pyright": "partial", "pytest": "cold"}
+
+    invalid = _run_builder(
+        tmp_path=tmp_path,
+        fail_on_quality="none",
+        fail_on_security="none",
+        threshold="80",
+        extra_args=("--tool-cache", "ruff=hot"),
+    )
+    assert invalid.returncode == 2
+    assert "NAME=warm, NAME=partial or NAME=cold" in invalid.stderr
+
+
+def test_builder_reports_timed_out_tools_with_partial_artifacts(tmp_path: Path) -> None:
+    _write_fixture_files(tmp_path)
+    truncated = '{"generalDiagnostics": [{"file": "src/a'
+    (tmp_path / "pyright.json").write_text(truncated, encoding="utf-8")
+    with (tmp_path / "command_status.tsv").open("a", encoding="utf-8") as f:
+        f.write("pyright\tpyright src\t124\ttimeout\tpyright.json\t600.000\t590.000\t1024\n")
+
+    result = _run_builder(
+        tmp_path=tmp_path,
+        fail_on_quality="any",
+        fail_on_security="none",
+        threshold="0",
+        write_fixtures=False,
+    )
+
+    assert result.returncode == 1
+    summary = json.loads((tmp_path / "quality_summary.json").read_text(encoding="utf-8"))
+    assert summary["incomplete"] == ["pyright"]
+    assert summary["checks"]["pyright"]["errors"] == 0
+    assert "pyright" in [c["name"] for c in summary["command_failures"]]
+    report = (tmp_path / "quality_report.md").read_text(encoding="utf-8")
+    assert "⏱ timeout" in report
+    assert "`pyright` was stopped after 600s" in report
+
+
+def test_truncated_json_lines_keep_the_findings_before_the_cut(tmp_path: Path) -> None:
+    _write_fixture_files(tmp_path)
+    finding = json.loads(RUFF_JSON)[0]
+    lines = [
+        json.dumps(finding | {"filename": f"src/mod_{i}.py", "location": {"row": i, "column": 1}})
+        for i in range(1, 4)
+    ]
+    cut = "\n".join(lines)[:-25]
+    (tmp_path / "ruff.json").write_text(cut, encoding="utf-8")
+    with (tmp_path / "command_status.tsv").open("a", encoding="utf-8") as f:
+        f.write("ruff\truff check .\t124\ttimeout\truff.json\t60.000\t59.000\t1024\n")
+
+    result = _run_builder(
+        tmp_path=tmp_path,
+        fail_on_quality="none",
+        fail_on_security="none",
+        threshold="0",
+        write_fixtures=False,
+    )
+
+    assert result.returncode == 0, result.stderr
+    summary = json.loads((tmp_path / "quality_summary.json").read_text(encoding="utf-8"))
+    assert summary["incomplete"] == ["ruff"]
+    assert summary["checks"]["ruff"]["issues"] == 2
+    sample = [summary["findings"][i]["filename"] for i in summary["checks"]["ruff"]["sample"]]
+    assert sample == ["src/mod_1.py", "src/mod_2.py"]
+    report = (tmp_path / "quality_report.md").read_text(encoding="utf-8")
+    assert "src/mod_2.py" in report and "src/mod_3.py" not in report
+
+
+def test_coverage_reports_in_cobertura_and_lcov_match_json(tmp_path: Path, monkeypatch) -> None:
+    builder = _load_builder_module()
+    source = tmp_path / "src"
+    (tmp_path / "coverage.xml").write_text(
+        '<?xml version="1.0" ?>\n'
+        '<coverage line-rate="0.5">'
+        f"<sources><source>{source}</source></sources><packages><package><classes>"
+        '<class filename="pkg/a.py"><methods/><lines>'
+        '<line number="1" hits="3"/><line number="2" hits="0"/><line number="3" hits="0"/>'
+        '<line number="4" hits="1"/></lines></class>'
+        '<class filename="pkg/b.py"><lines><line number="1" hits="1"/></lines></class>'
+        "</classes></package></packages></coverage>",
+        encoding="utf-8",
+    )
+    (tmp_path / "coverage.info").write_text(
+        f"TN:\nSF:{source}/pkg/a.py\nDA:1,3\nDA:2,0\nDA:3,0\nDA:4,1\nLF:4\nLH:2\nend_of_record\n"
+        "SF:src/pkg/b.py\nDA:1,1,abc\nend_of_record\n",
+        encoding="utf-8",
+    )
+    lcov_without_suffix = tmp_path / "lcov-report"
+    lcov_without_suffix.write_bytes((tmp_path / "coverage.info").read_bytes())
+
+    monkeypatch.chdir(tmp_path)
+    results = [
+        builder.parse_coverage_files([name], threshold=90.0)
+        for name in ["coverage.xml", "coverage.info", "lcov-report"]
+    ]
+
+    assert builder.sniff_coverage_format(str(lcov_without_suffix)) == "lcov"
+    for total, below in results:
+        assert total == 60.0
+        assert [(f.path, f.percent, f.missing_spans) for f in below] == [
+            ("src/pkg/a.py", 50.0, "2-3")
+        ]
+
+
+def test_cobertura_files_resolve_against_each_source_root(tmp_path: Path, monkeypatch) -> None:
+    builder = _load_builder_module()
+    monkeypatch.chdir(tmp_path)
+    for root, name in (("src", "app.py"), ("lib", "util.py")):
+        (tmp_path / root).mkdir()
+        (tmp_path / root / name).write_text("x = 1\n", encoding="utf-8")
+    classes = "".join(
+        f'<class filename="{name}"><lines><line number="1" hits="1"/></lines></class>'
+        for name in ("app.py", "util.py", "gone.py")
+    )
+    (tmp_path / "coverage.xml").write_text(
+        f"<coverage><sources><source>{tmp_path / 'src'}</source><source>{tmp_path / 'lib'}"
+        f"</source></sources><packages><package><classes>{classes}</classes></package>"
+        "</packages></coverage>",
+        encoding="utf-8",
+    )
+
+    files = [file_ for file_, _, _ in builder._cobertura_lines("coverage.xml")]
+
+    assert files == ["src/app.py", "lib/util.py", "gone.py"]
+
+
+def test_coverage_data_file_is_read_without_json_export(tmp_path: Path, monkeypatch) -> None:
+    pytest.importorskip("coverage")
+    builder = _load_builder_module()
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "src").mkdir()
+    (tmp_path / "src/mod.py").write_text(
+        "def used(x):\n"
+        "    if x:\n"
+        "        return (\n"
+        "            1\n"
+        "        )\n"
+        "    return 2\n"
+        "\n"
+        "def unused():  # pragma: no cover\n"
+        "    return 3\n"
+        "\n"
+        "def missed():\n"
+        "    return 4\n"
+        "\n"
+        "used(True)\n",
+        encoding="utf-8",
+    )
+    expected = None
+    for branch in ("--no-branch", "--branch"):
+        data_file = tmp_path / f".coverage{branch}"
+        run = [sys.executable, "-m", "coverage", "run", f"--data-file={data_file}"]
+        if branch == "--branch":
+            run.append(branch)
+        subprocess.run([*run, "src/mod.py"], check=True)
+
+        assert builder.sniff_coverage_format(str(data_file)) == "sqlite"
+        total, below = builder.parse_coverage_files([str(data_file)], threshold=100.0)
+        result = (total, [(f.path, f.percent, f.missing_spans) for f in below])
+        if expected is None:
+            subprocess.run(
+                [sys.executable, "-m", "coverage", "json", f"--data-file={data_file}"],
+                check=True,
+                capture_output=True,
+            )
+            total, below = builder.parse_coverage_files(["coverage.json"], threshold=100.0)
+            expected = (total, [(f.path, f.percent, f.missing_spans) for f in below])
+        assert result == expected == (71.43, [("src/mod.py", 71.43, "6, 12")])
+
+
+def test_coverage_data_file_reports_never_imported_modules(tmp_path: Path, monkeypatch) -> None:
+    pytest.importorskip("coverage")
+    builder = _load_builder_module()
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "src").mkdir()
+    (tmp_path / "src/run.py").write_text("x = 1\ny = 2\nz = 3\n", encoding="utf-8")
+    (tmp_path / "src/never.py").write_text(
+        "def f():\n    return 1\n\n\nVALUE = f()\n", encoding="utf-8"
+    )
+    data_file = tmp_path / ".coverage"
+    subprocess.run(
+        [
+            sys.executable,
+            "-m",
+            "coverage",
+            "run",
+            f"--data-file={data_file}",
+            "--source=src",
+            "src/run.py",
+        ],
+        check=True,
+    )
+    subprocess.run(
+        [sys.executable, "-m", "coverage", "json", f"--data-file={data_file}"],
+        check=True,
+        capture_output=True,
+    )
+
+    results = []
+    for path in (str(data_file), "coverage.json"):
+        total, below = builder.parse_coverage_files([path], threshold=100.0)
+        results.append((total, [(f.path, f.percent, f.missing_spans) for f in below]))
+    assert results[0] == results[1] == (50.0, [("src/never.py", 0.0, "1-2, 5")])
+
+
+@pytest.mark.parametrize("fmt", ["compact", "gzip", "zstd"])
+def test_compact_summaries_index_findings_and_work_as_baseline(tmp_path: Path, fmt: str) -> None:
+    if fmt == "zstd":
+        pytest.importorskip("zstandard")
+    builder = _load_builder_module()
+    result = _run_builder(
+        tmp_path,
+        fail_on_quality="none",
+        fail_on_security="none",
+        threshold="0",
+        extra_args=("--summary-format", fmt),
+    )
+    assert result.returncode == 0, result.stderr
+
+    summary_path = tmp_path / "quality_summary.json"
+    with builder.open_artifact(str(summary_path), "summary") as reader:
+        assert reader.mode == {"compact": "memory"}.get(fmt, fmt)
+        text = reader.read().decode("utf-8")
+    assert "\n" not in text
+    summary = json.loads(text)
+    assert list(summary)[-1] == "findings"
+    assert "raw_preview" not in summary
+    ruff = [summary["findings"][i] for i in summary["checks"]["ruff"]["sample"]]
+    assert [f["tool"] for f in ruff] == ["ruff"]
+    assert ruff[0]["code"] == json.loads(RUFF_JSON)[0]["code"]
+    assert sum(builder.load_baseline(str(summary_path), "ruff").values()) == 1
+
+
+def test_findings_ndjson_streams_every_record_in_serial_and_parallel(tmp_path: Path) -> None:
+    exports = []
+    for jobs in ("1", "3"):
+        run_dir = tmp_path / f"jobs-{jobs}"
+        run_dir.mkdir()
+        _write_fixture_files(run_dir)
+        ruff = [
+            {"code": "E501", "filename": f"src/m{i}.py", "location": {"row": i}, "message": "long"}
+            for i in range(120)
+        ]
+        (run_dir / "ruff.json").write_text(json.dumps(ruff), encoding="utf-8")
+        export = run_dir / "findings.ndjson"
+
+        result = _run_builder(
+            run_dir,
+            fail_on_quality="none",
+            fail_on_security="none",
+            threshold="100",
+            extra_args=("--jobs", jobs, "--findings-ndjson", str(export)),
+            write_fixtures=False,
+        )
+
+        assert result.returncode == 0, result.stderr
+        records = [json.loads(line) for line in export.read_text(encoding="utf-8").splitlines()]
+        exports.append(records)
+        assert not list(run_dir.glob("*.part"))
+        summary = json.loads((run_dir / "quality_summary.json").read_text(encoding="utf-8"))
+        assert len(summary["checks"]["ruff"]["sample"]) == 50
+
+    assert exports[0] == exports[1]
+    tools = Counter(record["tool"] for record in exports[0])
+    assert tools["ruff"] == 120
+    assert set(tools) == {"ruff", "pyright", "pytest", "coverage", "bandit"}
+    assert all(record["new"] for record in exports[0] if record["tool"] == "ruff")
+
+
+def test_sarif_output_has_one_run_per_tool_with_indexed_rules(tmp_path: Path) -> None:
+    _write_fixture_files(tmp_path)
+    ruff = [
+        {
+            "code": "E501" if i % 2 else "F401",
+            "filename": f"src/m{i}.py",
+            "location": {"row": i + 1, "column": 3},
+            "message": f"finding {i}",
+            "url": "https://docs.astral.sh/ruff/rules/",
+        }
+        for i in range(200)
+    ]
+    (tmp_path / "ruff.json").write_text(json.dumps(ruff), encoding="utf-8")
+    (tmp_path / "bandit.json").write_text('{"results": []}', encoding="utf-8")
+    sarif_path = tmp_path / "quality.sarif"
+
+    result = _run_builder(
+        tmp_path,
+        fail_on_quality="none",
+        fail_on_security="none",
+        threshold="0",
+        extra_args=("--jobs", "2", "--sarif", str(sarif_path)),
+        write_fixtures=False,
+    )
+
+    assert result.returncode == 0, result.stderr
+    sarif = json.loads(sarif_path.read_text(encoding="utf-8"))
+    assert sarif["version"] == "2.1.0"
+    runs = {run["tool"]["driver"]["name"]: run for run in sarif["runs"]}
+    assert list(runs) == ["ruff", "pyright", "bandit"]
+    rules = runs["ruff"]["tool"]["driver"]["rules"]
+    assert [rule["id"] for rule in rules] == ["F401", "E501"]
+    results = runs["ruff"]["results"]
+    assert len(results) == 200
+    assert all(rules[r["ruleIndex"]]["id"] == r["ruleId"] for r in results)
+    location = results[1]["locations"][0]["physicalLocation"]
+    assert location["artifactLocation"]["uri"] == "src/m1.py"
+    assert location["region"] == {"startLine": 2, "startColumn": 3}
+    assert runs["pyright"]["results"]
+    assert runs["bandit"]["results"] == []
+    assert not list(tmp_path.glob("*.part"))
+
+
+def test_report_sections_respect_byte_budgets_and_full_report_is_kept(tmp_path: Path) -> None:
+    _write_fixture_files(tmp_path)
+    ruff = [
+        {
+            "code": "E501",
+            "filename": f"src/m{i}.py",
+            "location": {"row": i + 1, "column": 1},
+            "message": "x" * 400,
+        }
+        for i in range(50)
+    ]
+    (tmp_path / "ruff.json").write_text(json.dumps(ruff), encoding="utf-8")
+    full = tmp_path / "quality_report_full.md"
+
+    result = _run_builder(
+        tmp_path,
+        fail_on_quality="none",
+        fail_on_security="none",
+        threshold="0",
+        extra_args=(
+            "--section-bytes",
+            "2000",
+            "--max-report-bytes",
+            "12000",
+            "--full-output",
+            str(full),
+        ),
+        write_fixtures=False,
+    )
+
+    assert result.returncode == 0, result.stderr
+    report = (tmp_path / "quality_report.md").read_text(encoding="utf-8")
+    full_report = full.read_text(encoding="utf-8")
+    assert len(report.encode("utf-8")) <= 12000
+    assert "\x1e" not in report and "\x1e" not in full_report
+    shown = report.count("| `E501` |")
+    assert 0 < shown < 50
+    assert f"_… {50 - shown} more lines omitted to keep this comment short" in report
+    assert full_report.count("| `E501` |") == 50
+    assert "omitted" not in full_report
+
+
+def test_budget_writer_truncates_overall_output_with_notice() -> None:
+    builder = _load_builder_module()
+    out = io.StringIO()
+    writer = builder.BudgetWriter(out, max_bytes=1000, section_bytes=None)
+    for i in range(100):
+        writer.write(f"line {i:03d} " + "y" * 40 + "\n")
+    writer.close()
+
+    text = out.getvalue()
+    assert len(text.encode("utf-8")) <= 1000
+    kept = text.count("line ")
+    assert text.endswith(
+        f"_Report truncated: {100 - kept} more lines omitted to stay under the comment size"
+        " limit. See the full report artifact._\n"
+    )
+
+
+def test_records_are_slotted_and_encoded_like_asdict() -> None:
+    from dataclasses import asdict
+
+    builder = _load_builder_module()
+    issue = builder.BanditIssue("src/é.py", 7, "HIGH", "LOW", "B602", "shell", 'say "hi"\n')
+    command = builder.CommandResult("pytest", "pytest -q", 1, "fail", wall_seconds=1.5)
+    coverage = builder.CoverageFile("src/a.py", 50.0, builder.compress_line_ranges([3, 4, 9]))
+    assert not hasattr(issue, "__dict__")
+
+    assert json.loads(builder.encode_record(issue, tool="bandit", new=True)) == {
+        "tool": "bandit",
+        "new": True,
+        **asdict(issue),
+    }
+    assert json.loads(builder.encode_record(command)) == asdict(command)
+    assert json.loads(builder.encode_record(coverage)) == {
+        "path": "src/a.py",
+        "percent": 50.0,
+        "missing_ranges": [[3, 4], [9, 9]],
+    }
+
+    payload = {"summary": command, "commands": [command], "empty": {}, "findings": []}
+    expected = {"summary": asdict(command), "commands": [asdict(command)], "empty": {}}
+    expected["findings"] = []
+    assert "".join(builder.iter_json(payload, 2)) == json.dumps(expected, indent=2)
+    compact = "".join(builder.iter_json({"files": [coverage], "raw": builder.RawJSON("[1]")}))
+    assert json.loads(compact) == {
+        "files": [json.loads(builder.encode_record(coverage))],
+        "raw": [1],
+    }
+
+
+def test_budget_writer_closes_details_cut_by_the_overall_budget() -> None:
+    builder = _load_builder_module()
+    out = io.StringIO()
+    writer = builder.BudgetWriter(out, max_bytes=900, section_bytes=None)
+    writer.write("## Report\n<details>\n<summary>Ruff</summary>\n\n")
+    writer.write(builder._section_marks("ruff") + "\n")
+    for i in range(60):
+        writer.write(f"| line {i:03d} | finding |\n")
+    writer.write(builder._section_marks() + "\n")
+    writer.write("</details>\n\nFooter\n")
+    writer.close()
+
+    text = out.getvalue()
+    assert len(text.encode("utf-8")) <= 900
+    assert text.count("<details>") == text.count("</details>") == 1
+    assert text.index("</details>") < text.index("_Report truncated:")
+    assert "Footer" not in text
@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+
+def _run_runner(tmp_path: Path, *args: str) -> subprocess.CompletedProcess[str]:
+    repo_root = Path(__file__).resolve().parents[2]
+    runner = repo_root / "actions/python/quality-report/src/runner.py"
+    cmd = [
+        sys.executable,
+        str(runner),
+        "--status",
+        str(tmp_path / "command_status.tsv"),
+        "--logs-dir",
+        str(tmp_path / "logs"),
+        *args,
+    ]
+    return subprocess.run(cmd, cwd=tmp_path, capture_output=True, text=True, check=False)
+
+
+def _window(tmp_path: Path, name: str) -> tuple[float, float]:
+    start, end = (tmp_path / f"{name}.window").read_text(encoding="utf-8").split()
+    return float(start), float(end)
+
+
+def _exits_within(pid: int, seconds: float) -> bool:
+    # The runner kills the whole process group, but the orphaned grandchild is
+    # reparented to init and reaped asynchronously: until then its pid still
+    # exists, so an immediate os.kill(pid, 0) check can fail the test spuriously.
+    deadline = time.monotonic() + seconds
+    while time.monotonic() < deadline:
+        try:
+            os.kill(pid, 0)
+        except ProcessLookupError:
+            return True
+        time.sleep(0.05)
+    return False
+
+
+def test_runner_runs_checks_concurrently_and_writes_status(tmp_path: Path) -> None:
+    timed = 'python3 -c "import time; print(time.time())" >> {name}.window'
+    slow = (
+        f"{timed.format(name='slow')}; sleep 1; echo done > slow.json; {timed.format(name='slow')}"
+    )
+    failing = (
+        f"{timed.format(name='failing')}; sleep 1; {timed.format(name='failing')}; "
+        "echo broken >&2; exit 3"
+    )
+
+    result = _run_runner(
+        tmp_path,
+        "--check",
+        "slow",
+        slow,
+        "slow.json",
+        "--check",
+        "failing",
+        failing,
+        "failing.json",
+    )
+
+    assert result.returncode == 0, result.stderr
+    slow_start, slow_end = _window(tmp_path, "slow")
+    failing_start, failing_end = _window(tmp_path, "failing")
+    assert slow_start < failing_end and failing_start < slow_end
+    rows = [
+        line.split("\t")
+        for line in (tmp_path / "command_status.tsv").read_text(encoding="utf-8").splitlines()
+    ]
+    assert [row[:5] for row in rows] == [
+        ["slow", slow, "0", "pass", "slow.json"],
+        ["failing", failing, "3", "fail", "failing.json"],
+    ]
+    for row in rows:
+        wall, cpu, max_rss_kb = float(row[5]), float(row[6]), int(row[7])
+        assert wall >= 1.0
+        assert cpu >= 0.0
+        assert max_rss_kb > 0
+    assert (tmp_path / "slow.json").read_text(encoding="utf-8") == "done\n"
+    assert (tmp_path / "logs" / "failing.log").read_text(encoding="utf-8").endswith("broken\n")
+    assert "::group::failing (fail, exit code 3)" in result.stdout
+
+
+def test_runner_stops_checks_over_budget_and_records_timeout(tmp_path: Path) -> None:
+    hung = "echo '{\"partial\"' > hung.json; sleep 60 & echo $! > child.pid; wait"
+
+    result = _run_runner(tmp_path, "--check", "hung", hung, "hung.json", "--timeout", "hung", "4")
+
+    assert result.returncode == 0, result.stderr
+    row = (tmp_path / "command_status.tsv").read_text(encoding="utf-8").split("\t")
+    assert row[2:4] == ["124", "timeout"]
+    assert 4.0 <= float(row[5]) < 30.0
+    assert (tmp_path / "hung.json").read_text(encoding="utf-8") == '{"partial"\n'
+    child = int((tmp_path / "child.pid").read_text(encoding="utf-8"))
+    assert _exits_within(child, seconds=5.0)
+    assert "exceeded its 4s budget" in (tmp_path / "logs" / "hung.log").read_text(encoding="utf-8")
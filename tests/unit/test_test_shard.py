@@ -0,0 +1,169 @@
+from __future__ import annotations
+
+import importlib.util
+import json
+import subprocess
+import sys
+from pathlib import Path
+from types import ModuleType
+
+SHARD_PATH = Path(__file__).resolve().parents[2] / "actions/python/test-shard/src/shard.py"
+
+
+def _load_shard_module() -> ModuleType:
+    spec = importlib.util.spec_from_file_location("test_shard_cli", SHARD_PATH)
+    assert spec and spec.loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def test_partition_balances_durations_with_longest_first() -> None:
+    shard = _load_shard_module()
+    durations = {"a": 7.0, "b": 5.0, "c": 4.0, "d": 3.0, "e": 3.0, "f": 2.0}
+
+    shards = shard.partition(durations, 2)
+
+    assert [s.seconds for s in shards] == [12.0, 12.0]
+    assert sorted(t for s in shards for t in s.tests) == sorted(durations)
+    assert shard.partition({"only": 1.0}, 3)[2].tests == []
+
+
+def test_junit_timings_map_to_files_and_node_ids(tmp_path: Path) -> None:
+    shard = _load_shard_module()
+    junit = tmp_path / "junit.xml"
+    junit.write_text(
+        "<testsuites><testsuite>"
+        '<testcase classname="tests.unit.test_a.TestA" name="test_x[1]" time="2.5"/>'
+        '<testcase classname="tests.unit.test_a" name="test_y" time="1.5"/>'
+        '<testcase classname="tests.test_b" name="test_z" time="4"/>'
+        "</testsuite></testsuites>",
+        encoding="utf-8",
+    )
+    modules = {"tests.unit.test_a": "tests/unit/test_a.py"}
+
+    by_file = shard.load_durations([str(junit)], "file", modules)
+    by_test = shard.load_durations([str(junit)], "test", modules)
+
+    assert by_file == {"tests/unit/test_a.py": 4.0, "tests/test_b.py": 4.0}
+    assert by_test["tests/unit/test_a.py::TestA::test_x[1]"] == 2.5
+    assert by_test["tests/test_b.py::test_z"] == 4.0
+
+
+def test_cli_gives_unseen_tests_the_median_duration(tmp_path: Path) -> None:
+    tests_dir = tmp_path / "tests"
+    tests_dir.mkdir()
+    for name in ["test_slow", "test_fast", "test_mid", "test_new"]:
+        (tests_dir / f"{name}.py").write_text("", encoding="utf-8")
+    (tmp_path / "junit.xml").write_text(
+        "<testsuite>"
+        '<testcase classname="tests.test_slow" name="t" time="9"/>'
+        '<testcase classname="tests.test_fast" name="t" time="1"/>'
+        '<testcase classname="tests.test_mid" name="t" time="3"/>'
+        '<testcase classname="tests.test_gone" name="t" time="50"/>'
+        "</testsuite>",
+        encoding="utf-8",
+    )
+    outputs = tmp_path / "gh_outputs.txt"
+
+    result = subprocess.run(
+        [
+            sys.executable,
+            str(SHARD_PATH),
+            "--junit",
+            "junit*.xml",
+            "--shards",
+            "2",
+            "--index",
+            "1",
+            "--test-dir",
+            "tests",
+            "--plan",
+            "plan.json",
+            "--outputs",
+            str(outputs),
+        ],
+        cwd=tmp_path,
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+
+    assert result.returncode == 0, result.stderr
+    plan = json.loads((tmp_path / "plan.json").read_text(encoding="utf-8"))
+    # test_new gets the 3s median of the tests that still exist; test_gone is dropped.
+    assert plan[0]["tests"] == ["tests/test_slow.py"]
+    assert plan[1]["tests"] == ["tests/test_fast.py", "tests/test_mid.py", "tests/test_new.py"]
+    assert "tests=tests/test_fast.py tests/test_mid.py tests/test_new.py" in outputs.read_text(
+        encoding="utf-8"
+    )
+
+
+def _run_shard(tmp_path: Path, *args: str) -> subprocess.CompletedProcess[str]:
+    return subprocess.run(
+        [sys.executable, str(SHARD_PATH), "--junit", "junit.xml", "--shards", "2", *args],
+        cwd=tmp_path,
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+
+
+def test_cli_test_granularity_shards_collected_ids_only(tmp_path: Path) -> None:
+    (tmp_path / "junit.xml").write_text(
+        "<testsuite>"
+        '<testcase file="tests/test_a.py" classname="tests.test_a" name="test_x" time="4"/>'
+        '<testcase file="tests/test_a.py" classname="tests.test_a" name="test_removed" time="9"/>'
+        '<testcase file="tests/test_b.py" classname="tests.test_b" name="test_y" time="2"/>'
+        "</testsuite>",
+        encoding="utf-8",
+    )
+    (tmp_path / "collected.txt").write_text(
+        "tests/test_a.py::test_x\ntests/test_a.py::test_new\ntests/test_b.py::test_y\n\n"
+        "3 tests collected in 0.01s\n",
+        encoding="utf-8",
+    )
+
+    result = _run_shard(
+        tmp_path, "--granularity", "test", "--tests-file", "collected.txt", "--plan", "plan.json"
+    )
+
+    assert result.returncode == 0, result.stderr
+    plan = json.loads((tmp_path / "plan.json").read_text(encoding="utf-8"))
+    assert sorted(test for shard in plan for test in shard["tests"]) == [
+        "tests/test_a.py::test_new",
+        "tests/test_a.py::test_x",
+        "tests/test_b.py::test_y",
+    ]
+    assert "1 of 3 tests had no recorded duration" in result.stderr
+
+    result = _run_shard(tmp_path, "--granularity", "test", "--test-dir", "tests")
+    assert result.returncode == 2
+    assert "--granularity test needs --tests-file" in result.stderr
+
+
+def test_cli_file_granularity_shards_collected_ids_as_files(tmp_path: Path) -> None:
+    (tmp_path / "junit.xml").write_text(
+        "<testsuite>"
+        '<testcase classname="tests.test_a" name="t1" time="5"/>'
+        '<testcase classname="tests.test_a" name="t2" time="5"/>'
+        '<testcase classname="tests.test_b" name="t" time="3"/>'
+        '<testcase classname="tests.test_c" name="t" time="4"/>'
+        "</testsuite>",
+        encoding="utf-8",
+    )
+    (tmp_path / "collected.txt").write_text(
+        "tests/test_a.py::t1\ntests/test_a.py::t2\ntests/test_b.py::t\ntests/test_c.py::t\n",
+        encoding="utf-8",
+    )
+
+    result = _run_shard(tmp_path, "--tests-file", "collected.txt", "--plan", "plan.json")
+
+    assert result.returncode == 0, result.stderr
+    plan = json.loads((tmp_path / "plan.json").read_text(encoding="utf-8"))
+    assert [(shard["tests"], shard["seconds"]) for shard in plan] == [
+        (["tests/test_a.py"], 10.0),
+        (["tests/test_b.py", "tests/test_c.py"], 7.0),
+    ]
+    assert "0 of 3 tests had no recorded duration" in result.stderr